@@ -40,7 +40,8 @@ class Config:
     API_CONFIG = {
         'require_image_url': False,
         'require_k8s_auth': False,
-        'enable_swagger': True,
+        # Set ENABLE_SWAGGER=false to keep flasgger (and its spec walk) out of the process
+        'enable_swagger': os.getenv(ConfigKeys.ENABLE_SWAGGER, 'true').lower() == 'true',
         'cors_origins': ['http://localhost:4200', 'http://127.0.0.1:4200']
     }
     
@@ -4,6 +4,7 @@ Centralized definition of all constants used throughout the application.
 """
 
 from enum import Enum
+from functools import lru_cache
 from typing import List, Optional
 import os
 import subprocess
@@ -155,6 +156,43 @@ class KubernetesConstants:
     ALREADY_EXISTS = 409
     NOT_FOUND = 404
     CONFLICT = 409
+    
+    # Keep-alive connections per API client (sized for concurrent delete calls)
+    CONNECTION_POOL_MAXSIZE = 32
+    
+    # Retries for requests that fail on a pooled connection (e.g. one the API
+    # server closed while idle); connect failures are not retried, so an
+    # unreachable cluster still fails fast
+    REQUEST_RETRIES = 2
+    REQUEST_RETRY_BACKOFF = 0.1
+    
+    # resourceVersion for read-only listings: "0" lets the API server answer
+    # from its watch cache instead of a quorum read from etcd (may lag by a
+    # moment, so not used where freshly created objects must be seen)
+    CACHED_LIST_RESOURCE_VERSION = "0"
+
+
+class CacheConfig:
+    """In-process cache settings."""
+    
+    # How long provider cluster reads (nodes/pods) are reused, in seconds
+    PROVIDER_DATA_TTL = 2
+
+
+class ResponseLimits:
+    """API response size settings."""
+    
+    # /servers responses covering at least this many pods are streamed
+    STREAM_MIN_PODS = 500
+    
+    # Cache-Control max-age (seconds) for polled GETs; 0 = revalidate via ETag every time.
+    # /servers must reflect a create/delete immediately, health data only changes per monitor cycle.
+    SERVERS_MAX_AGE = 0
+    HEALTH_MAX_AGE = 5
+    
+    # JSON/HTML bodies at least this large are gzipped for clients that accept it
+    COMPRESS_MIN_SIZE = 1024
+    COMPRESS_LEVEL = 5
 
 
 class ValidationRules:
@@ -163,7 +201,8 @@ class ValidationRules:
     # Pod name rules
     POD_NAME_MIN_LENGTH = 1
     POD_NAME_MAX_LENGTH = 63
-    POD_NAME_PATTERN = r'^[a-z0-9]([a-z0-9-]*[a-z0-9])?$'
+    # DNS-1123 label; \Z rather than $, which would also accept a trailing newline
+    POD_NAME_PATTERN = r'^[a-z0-9]([a-z0-9-]*[a-z0-9])?\Z'
     
     # Resource limits
     MAX_GPUS = 16
@@ -197,12 +236,18 @@ class ConfigKeys:
     # CORS
     CORS_ORIGINS = "CORS_ORIGINS"
     
+    # API docs
+    ENABLE_SWAGGER = "ENABLE_SWAGGER"
+    
     # Kubernetes
     KUBECONFIG = "KUBECONFIG"
     
     # Flask
     FLASK_ENV = "FLASK_ENV"
     FLASK_DEBUG = "FLASK_DEBUG"
+    
+    # Profiling (set to "1" to write a cProfile dump per request)
+    PROFILE = "PROFILE"
 
 
 class ErrorMessages:
@@ -225,6 +270,7 @@ class ErrorMessages:
     POD_NAME_REQUIRED = "Pod name is required."
     POD_NAME_LOWERCASE = "Pod name must be lowercase."
     POD_NAME_NO_UNDERSCORE = "Pod name must not contain underscores."
+    POD_NAME_INVALID = "Pod name must be at most 63 lowercase alphanumeric characters or '-', starting and ending with an alphanumeric character."
     RESOURCES_REQUIRED = "Resources must be specified."
     IMAGE_URL_REQUIRED = "Image URL is required in production environment."
     
@@ -285,6 +331,16 @@ class TimeFormats:
 class FilePaths:
     """File path constants."""
     
+    # Absolute path of the server/pod master configuration (backend/data/master.json),
+    # resolved once at import instead of on every load/save
+    MASTER_CONFIG = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'master.json'
+    )
+
+    # Per-request cProfile dumps when ConfigKeys.PROFILE is enabled
+    PROFILE_DIR = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'profiles'
+    )
 
     CONFIG_FILE = ".env"
     LOG_FILE = "app.log"
@@ -345,6 +401,9 @@ class HealthCheckConfig:
     MAX_FAILED_PODS_PERCENT = 20  # Maximum percentage of failed pods before cluster is degraded
     MAX_API_LATENCY_MS = 1000     # Maximum API server latency in milliseconds
     
+    # Forced checks (/health) reuse a result this fresh instead of re-probing
+    FORCED_CHECK_TTL = 0.5        # Seconds
+    
     # Retry settings
     MAX_RETRIES = 3               # Maximum number of retries for health checks
     RETRY_DELAY = 5               # Delay between retries in seconds 
@@ -362,12 +421,16 @@ class Ports:
     BACKEND_PORT_ENV = 'BACKEND_PORT'
     KUBERNETES_API_PORT_ENV = 'KUBERNETES_API_PORT'
     
+    # Port getters parse the environment once per process; call
+    # <getter>.cache_clear() after changing the environment variables.
     @classmethod
+    @lru_cache(maxsize=1)
     def get_backend_port(cls) -> int:
         """Get backend port from environment or use default"""
         return int(os.getenv(cls.BACKEND_PORT_ENV, cls.BACKEND_DEFAULT))
     
     @classmethod
+    @lru_cache(maxsize=1)
     def get_kubernetes_api_port(cls) -> int:
         """Get Kubernetes API port from environment or use default"""
         return int(os.getenv(cls.KUBERNETES_API_PORT_ENV, cls.KUBERNETES_API_DEFAULT)) 
\ No newline at end of file
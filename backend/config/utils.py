@@ -4,9 +4,13 @@ This module contains helper functions and Kubernetes resource management logic.
 """
 
 import json
+import mmap
 import os
+import re
 import tempfile
+import threading
 import uuid
+import orjson
 import yaml
 from datetime import datetime
 from kubernetes import client, config as k8s_config
@@ -17,10 +21,125 @@ from config.config import Config
 from core.k8s_client import k8s_client
 from config.constants import (
     ResourceType, PodStatus, DefaultValues, ErrorMessages,
-    SuccessMessages, TimeFormats
+    SuccessMessages, TimeFormats, ValidationRules
 )
 
 
+# Resource keys checked by validate_resource_request
+_VALIDATED_RESOURCE_KEYS = (
+    ResourceType.GPUS.value, ResourceType.RAM_GB.value, ResourceType.STORAGE_GB.value
+)
+
+_POD_NAME_RE = re.compile(ValidationRules.POD_NAME_PATTERN)
+
+# Required /create fields; image_url joins them when Config.require_image_url() is set
+_CREATE_REQUIRED_FIELDS = ('server_id',)
+_CREATE_REQUIRED_FIELDS_WITH_IMAGE = _CREATE_REQUIRED_FIELDS + ('image_url',)
+
+# Parsed JSON files keyed by path -> (file signature, data)
+_json_file_cache = {}
+_json_file_lock = threading.RLock()
+
+
+def _file_signature(stat_result):
+    """Identify a file version by inode, size and modification time."""
+    return (stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
+
+
+def get_file_signature(path):
+    """
+    Get a cheap change marker for a file without reading it.
+    
+    Args:
+        path (str): Path to the file
+        
+    Returns:
+        tuple: (inode, size, mtime_ns), or None if the file cannot be stat'ed
+    """
+    try:
+        return _file_signature(os.stat(path))
+    except OSError:
+        return None
+
+
+def load_json_file(path, cached=False):
+    """
+    Load a JSON document from disk via a read-only memory map.
+    
+    Args:
+        path (str): Path to the JSON file
+        cached (bool): Return the shared in-memory copy while the file is
+            unchanged on disk. The result must then be treated as read-only.
+        
+    Returns:
+        dict: Parsed JSON data
+    """
+    if not cached:
+        return _read_json_file(path)
+    
+    with _json_file_lock:
+        signature = _file_signature(os.stat(path))
+        entry = _json_file_cache.get(path)
+        if entry and entry[0] == signature:
+            return entry[1]
+        
+        data = _read_json_file(path)
+        _json_file_cache[path] = (signature, data)
+        return data
+
+
+def _read_json_file(path):
+    """Parse a JSON file from a read-only memory map."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b'')  # mmap cannot map an empty file
+        
+        # Parse straight from the mapped pages instead of copying into a buffer first
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        finally:
+            mm.close()
+
+
+def save_json_file(path, data):
+    """
+    Atomically write a JSON document to disk (2-space indented).
+    
+    The data is written to a temporary file in the same directory and moved
+    over path with os.replace, so readers never see a partially written file.
+    
+    Args:
+        path (str): Path to the JSON file
+        data (dict): Data to serialize
+    """
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    with _json_file_lock:
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            # Keep the permissions of the file being replaced (mkstemp uses 0600)
+            try:
+                os.chmod(temp_path, os.stat(path).st_mode & 0o777)
+            except FileNotFoundError:
+                os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            _json_file_cache.pop(path, None)
+            raise
+        
+        # Write-through: seed the cache from the bytes just written so the next
+        # cached load skips the disk read. Parsing the payload (rather than
+        # storing data) keeps the cached copy independent of the caller's object.
+        _json_file_cache[path] = (_file_signature(os.stat(path)), orjson.loads(payload))
+
+
 def get_available_resources(server):
     """
     Get available resources for a server.
@@ -60,11 +179,9 @@ def validate_resource_request(server, requested):
     """
     # Get available resources from live server data
     available = get_available_resources(server)
-    resource_types = [ResourceType.GPUS, ResourceType.RAM_GB, ResourceType.STORAGE_GB]
     
     # Validate each resource type against live Kubernetes data
-    for resource_type in resource_types:
-        key = resource_type.value
+    for key in _VALIDATED_RESOURCE_KEYS:
         requested_amount = requested.get(key, 0)
         available_amount = available.get(key, 0)
         
@@ -78,6 +195,93 @@ def validate_resource_request(server, requested):
     return True, None
 
 
+def validate_server_resources(server):
+    """
+    Check a server's resource bookkeeping for consistency.
+    
+    Args:
+        server (dict): Server data with 'name', 'resources' and 'pods'
+        
+    Returns:
+        list: Error messages (empty if consistent)
+    """
+    errors = []
+    name = server['name']
+    total = server['resources']['total']
+    available = server['resources']['available']
+    
+    # Check available <= total for each resource
+    for key, total_amount in total.items():
+        if available.get(key, 0) > total_amount:
+            errors.append(f"Server {name}: available {key} > total {key}")
+    
+    # Check sum of pod resources <= total for each resource, accumulating
+    # every resource's sum in one pass over the pods
+    pod_sums = dict.fromkeys(total, 0)
+    has_requests = False
+    for pod in server.get('pods', []):
+        requested = pod.get('requested') if isinstance(pod, dict) else None
+        if not isinstance(requested, dict):
+            continue
+        has_requests = True
+        for key, amount in requested.items():
+            if key in pod_sums:
+                pod_sums[key] += amount
+    if has_requests:
+        for key, total_amount in total.items():
+            if pod_sums[key] > total_amount:
+                errors.append(f"Server {name}: sum of pod {key} > total {key}")
+    
+    return errors
+
+
+def is_valid_pod_name(pod_name):
+    """True if pod_name is a DNS-1123 label (the Kubernetes rule for pod and namespace names)."""
+    return (
+        isinstance(pod_name, str)
+        and len(pod_name) <= ValidationRules.POD_NAME_MAX_LENGTH
+        and _POD_NAME_RE.fullmatch(pod_name) is not None
+    )
+
+
+def validate_pod_creation_input(data):
+    """
+    Validate a /create request body in a single pass.
+    
+    Args:
+        data (dict): Parsed request body
+        
+    Returns:
+        list: Validation error messages (empty if the payload is valid)
+    """
+    required = _CREATE_REQUIRED_FIELDS_WITH_IMAGE if Config.require_image_url() else _CREATE_REQUIRED_FIELDS
+    errors = [f'{field} is required' for field in required if not data.get(field)]
+    
+    # Pod name is optional (auto-generated when empty); the compiled pattern
+    # accepts valid names in one match, detailed messages only on failure
+    pod_name = data.get('pod_name', '')
+    if pod_name and not is_valid_pod_name(pod_name):
+        name_errors = []
+        if isinstance(pod_name, str):
+            # islower() is False for names without letters (e.g. "1_2"), so compare instead
+            if pod_name != pod_name.lower():
+                name_errors.append(ErrorMessages.POD_NAME_LOWERCASE)
+            if '_' in pod_name:
+                name_errors.append(ErrorMessages.POD_NAME_NO_UNDERSCORE)
+        errors.extend(name_errors or [ErrorMessages.POD_NAME_INVALID])
+    
+    replicas = data.get('replicas', 1)
+    if type(replicas) is not int or not 1 <= replicas <= 100:
+        errors.append('Replica count must be an integer between 1 and 100')
+    
+    # Individual resource values are not checked here: missing or null amounts
+    # count as 0 when resources are reserved
+    if not isinstance(data.get('Resources', {}), dict):
+        errors.append('Resources must be a dictionary/object')
+    
+    return errors
+
+
 def fetch_kubeconfig_k8s(machine_ip, username, password):
     """
     SSH to VM and fetch kubeconfig file (Kubernetes mode).
@@ -241,6 +445,37 @@ def delete_pod_k8s(pod_data):
 
  
 
+# Kubernetes (and already user-friendly) pod states -> user-friendly state
+_STATUS_MAPPING = {
+    # Kubernetes states to user-friendly states
+    'Running': 'online',
+    'Pending': 'starting',
+    'Failed': 'failed',
+    'Succeeded': 'online',
+    'Unknown': 'unknown',
+    'Terminated': 'failed',
+    'CrashLoopBackOff': 'error',
+    'ImagePullBackOff': 'error',
+    'ErrImagePull': 'error',
+    'CreateContainerError': 'error',
+    'CreateContainerConfigError': 'error',
+    'InvalidImageName': 'error',
+    'ContainerCreating': 'starting',
+    'PodInitializing': 'starting',
+    'Terminating': 'updating',
+    
+    # User-friendly states (pass through)
+    'online': 'online',
+    'starting': 'starting',
+    'in-progress': 'in-progress',
+    'updating': 'updating',
+    'failed': 'failed',
+    'error': 'error',
+    'unknown': 'unknown',
+    'timeout': 'timeout'
+}
+
+
 def map_kubernetes_status_to_user_friendly(kubernetes_status: str) -> str:
     """
     Map Kubernetes pod status to user-friendly status.
@@ -251,36 +486,7 @@ def map_kubernetes_status_to_user_friendly(kubernetes_status: str) -> str:
     Returns:
         User-friendly status string
     """
-    status_mapping = {
-        # Kubernetes states to user-friendly states
-        'Running': 'online',
-        'Pending': 'starting',
-        'Failed': 'failed',
-        'Succeeded': 'online',
-        'Unknown': 'unknown',
-        'Terminated': 'failed',
-        'CrashLoopBackOff': 'error',
-        'ImagePullBackOff': 'error',
-        'ErrImagePull': 'error',
-        'CreateContainerError': 'error',
-        'CreateContainerConfigError': 'error',
-        'InvalidImageName': 'error',
-        'ContainerCreating': 'starting',
-        'PodInitializing': 'starting',
-        'Terminating': 'updating',
-        
-        # User-friendly states (pass through)
-        'online': 'online',
-        'starting': 'starting',
-        'in-progress': 'in-progress',
-        'updating': 'updating',
-        'failed': 'failed',
-        'error': 'error',
-        'unknown': 'unknown',
-        'timeout': 'timeout'
-    }
-    
-    return status_mapping.get(kubernetes_status, 'unknown')
+    return _STATUS_MAPPING.get(kubernetes_status, 'unknown')
 
 def get_status_color(status: str) -> str:
     """
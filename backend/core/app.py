@@ -8,12 +8,14 @@ import warnings
 warnings.filterwarnings('ignore', message='Unverified HTTPS request')
 warnings.filterwarnings('ignore', category=Warning, module='urllib3')
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
 import json
 import os
+import time
+import orjson
 from datetime import datetime
-from flasgger import Swagger
 
 # Load environment variables from .env file
 try:
@@ -30,13 +32,18 @@ from config.config import Config
 from config.utils import (
     get_available_resources,
     validate_resource_request,
+    validate_server_resources,
     create_pod_k8s,
-    delete_pod_k8s
+    delete_pod_k8s,
+    is_valid_pod_name,
+    validate_pod_creation_input
 )
 
 from core.server_manager import server_manager
 from core.health_monitor import health_monitor
-from config.constants import Ports, PodStatus, ConfigKeys, APP_CONFIG
+from config.constants import (
+    Ports, PodStatus, ConfigKeys, FilePaths, ResponseLimits, ClusterStatus, ErrorMessages, APP_CONFIG
+)
 
 # Import server configuration API
 from core.server_configuration_api import server_config_bp
@@ -44,22 +51,53 @@ from core.server_configuration_api import server_config_bp
 # Import background refresh service
 from core.background_refresh_service import background_refresh_service
 
+# Import orjson-backed JSON provider
+from core.json_provider import (
+    ORJSONProvider, conditional_jsonify, cached_conditional_jsonify, stream_json_array,
+    prebuilt_json, json_bytes_response, stream_ndjson, wants_ndjson, compress_response
+)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+app.after_request(compress_response)
+
+# Resolve API configuration once at import; it is static for the process lifetime
+API_CONFIG = Config.get_api_config()
 
 # Configure CORS based on environment
-cors_origins = Config.get_cors_origins()
+cors_origins = API_CONFIG['cors_origins']
 if cors_origins:
     CORS(app, origins=cors_origins)
 else:
     CORS(app)
 
-# Configure Swagger based on environment
-if Config.get_api_config()['enable_swagger']:
+# Configure Swagger based on environment (flasgger is only imported when enabled)
+if API_CONFIG['enable_swagger']:
+    from flasgger import Swagger
     swagger = Swagger(app)
 
 # Register server configuration blueprint
 app.register_blueprint(server_config_bp)
 
+# Constant body for unexpected errors (exception text is logged, not sent to clients)
+_SERVER_ERROR_BODY = prebuilt_json({'error': 'Server error'})
+
+
+@app.errorhandler(Exception)
+def handle_unexpected_error(e):
+    """Turn exceptions that escape a route into a JSON 500 response."""
+    if isinstance(e, HTTPException):
+        return e
+    print(f"❌ Unhandled error on {request.method} {request.path}: {e}")
+    return json_bytes_response(_SERVER_ERROR_BODY, 500)
+
+# Opt-in profiling: PROFILE=1 writes one .prof file per request (inspect with snakeviz)
+if os.getenv(ConfigKeys.PROFILE) == '1':
+    from werkzeug.middleware.profiler import ProfilerMiddleware
+    os.makedirs(FilePaths.PROFILE_DIR, exist_ok=True)
+    app.wsgi_app = ProfilerMiddleware(app.wsgi_app, stream=None, profile_dir=FilePaths.PROFILE_DIR)
+    print(f"🔍 Request profiling enabled, writing to {FilePaths.PROFILE_DIR}")
+
 
 
 # Add at module level
@@ -69,29 +107,9 @@ BACKEND_START_TIME = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
 
-# --- API Endpoints ---
-@app.route('/')
-def index():
-    # Get application configuration
-    display_name = APP_CONFIG["display_name"]
-    description = APP_CONFIG["description"]
-    capabilities = APP_CONFIG["capabilities"]
-    
-    # Try to get a quick cluster/server summary
-    try:
-        servers = server_manager.get_all_servers_static()
-        total_servers = len(servers)
-        total_pods = sum(len(s.get('pods', [])) for s in servers)
-    except Exception:
-        total_servers = 'N/A'
-        total_pods = 'N/A'
-    
-    # Capabilities as badges
-    # cap_html = ''.join([
-    #     f'<span style="display:inline-block;background:#eef;border-radius:8px;padding:2px 8px;margin:2px 4px;font-size:0.95em;">{k.replace('_',' ').title()}: <b>{"Yes" if v else "No"}</b></span>'
-    #     for k,v in capabilities.items()
-    # ])
-    return f'''
+# Static parts of the index page, rendered and UTF-8 encoded once at import;
+# only the server/pod summary rows are built per request
+_INDEX_HTML_HEAD = f'''
     <html>
     <head>
         <title>Resource Manager Backend</title>
@@ -117,17 +135,16 @@ def index():
             <b>Started:</b> <span class="badge">{BACKEND_START_TIME}</span>
         </div>
         <div class="info-row">
-            <b>Application:</b> <span class="badge">{display_name}</span>
+            <b>Application:</b> <span class="badge">{APP_CONFIG["display_name"]}</span>
         </div>
         <div class="info-row">
-            <b>Description:</b> {description}
+            <b>Description:</b> {APP_CONFIG["description"]}
         </div>
         <div class="info-row">
             <b>Cluster/Server Summary:</b>
             <table class="summary-table">
-                <tr><td>Total Servers:</td><td><b>{total_servers}</b></td></tr>
-                <tr><td>Total Pods:</td><td><b>{total_pods}</b></td></tr>
-            </table>
+'''.encode('utf-8')
+_INDEX_HTML_TAIL = '''            </table>
         </div>
         
         <div class="section-title">Current Server Status</div>
@@ -186,7 +203,26 @@ def index():
     </div>
     </body>
     </html>
-    '''
+    '''.encode('utf-8')
+
+
+# --- API Endpoints ---
+@app.route('/')
+def index():
+    # Try to get a quick cluster/server summary (counted straight from master.json data)
+    try:
+        servers = server_manager.master_config.get('servers', [])
+        total_servers = len(servers)
+        total_pods = sum(len(s.get('pods', [])) for s in servers)
+    except Exception:
+        total_servers = 'N/A'
+        total_pods = 'N/A'
+    
+    summary_rows = (
+        f'                <tr><td>Total Servers:</td><td><b>{total_servers}</b></td></tr>\n'
+        f'                <tr><td>Total Pods:</td><td><b>{total_pods}</b></td></tr>\n'
+    ).encode('utf-8')
+    return Response(_INDEX_HTML_HEAD + summary_rows + _INDEX_HTML_TAIL, mimetype='text/html')
 
 
 @app.route('/servers', methods=['GET'])
@@ -196,6 +232,9 @@ def get_servers():
     ---
     tags:
       - Servers
+    produces:
+      - application/json
+      - application/x-ndjson
     parameters:
       - in: query
         name: server_id
@@ -220,17 +259,32 @@ def get_servers():
         examples:
           application/json:
             error: "Server error"
-            details: "<details>"
     """
-    try:
-        # Check if specific server is requested
-        server_id = request.args.get('server_id')
-        
-        servers = server_manager.get_all_servers_static()
-        return jsonify(servers), 200
-            
-    except Exception as e:
-        return jsonify({'error': f'Server error: {str(e)}'}), 500
+    # Check if specific server is requested: look it up by id instead of
+    # building and encoding every server
+    server_id = request.args.get('server_id')
+    if server_id:
+        server = server_manager.get_server_static(server_id)
+        return conditional_jsonify(
+            [server] if server else [], max_age=ResponseLimits.SERVERS_MAX_AGE
+        )
+
+    # Clients asking for newline-delimited JSON get one server per line
+    if wants_ndjson():
+        return stream_ndjson(server_manager.get_all_servers_static())
+
+    # Stream large clusters server by server instead of building one big body
+    master_servers = server_manager.master_config.get('servers', [])
+    if sum(len(s.get('pods', [])) for s in master_servers) >= ResponseLimits.STREAM_MIN_PODS:
+        return stream_json_array(server_manager.get_all_servers_static())
+
+    # Reuse the encoded body until master.json is rewritten or reloaded
+    return cached_conditional_jsonify(
+        'servers',
+        server_manager.config_version(),
+        server_manager.get_all_servers_static,
+        max_age=ResponseLimits.SERVERS_MAX_AGE
+    )
 
 @app.route('/create', methods=['POST'])
 def create_pod():
@@ -277,28 +331,20 @@ def create_pod():
         description: Server error
     """
     try:
-        req = request.json
-        if req is None:
-            return jsonify({'error': 'Invalid JSON data'}), 400
+        # silent=True: malformed bodies become a 400 here rather than a raised 415/400
+        req = request.get_json(silent=True)
+        if not isinstance(req, dict):
+            return json_bytes_response(_INVALID_JSON_BODY, 400)
         
-        # Get server_id from request
-        server_id = req.get('server_id')
-        if not server_id:
-            return jsonify({'error': 'server_id is required'}), 400
+        # Validate server_id, pod name, replica count and resources in one pass
+        errors = validate_pod_creation_input(req)
+        if errors:
+            return jsonify({'error': ' | '.join(errors)}), 400
         
+        server_id = req['server_id']
         # Pod name will be auto-generated by Kubernetes if not provided
         pod_name = req.get('pod_name', '')  # Optional, will be auto-generated if empty
         
-        # Validate replica count
-        replicas = req.get('replicas', 1)
-        if not isinstance(replicas, int) or replicas < 1 or replicas > 100:
-            return jsonify({'error': 'Replica count must be an integer between 1 and 100'}), 400
-        
-        # Validate resources
-        resources = req.get('Resources', {})
-        if not isinstance(resources, dict):
-            return jsonify({'error': 'Resources must be a dictionary/object'}), 400
-        
         # Create pod using server manager
         print(f"🚀 Creating pod {pod_name} on server {server_id}")
         result = server_manager.create_pod(server_id, req)
@@ -322,6 +368,15 @@ def create_pod():
         return jsonify({'error': 'Server error', 'details': str(e)}), 500
 
 
+# Constant bodies for unparseable or non-object request JSON and a successful delete
+_INVALID_JSON_BODY = prebuilt_json({'error': 'Invalid JSON data'})
+_POD_DELETED_BODY = prebuilt_json({'type': 'success', 'message': 'Pod deleted'})
+_INVALID_POD_NAME_BODY = prebuilt_json({'error': ErrorMessages.POD_NAME_INVALID})
+
+# Checked in order so the first missing field is reported
+_DELETE_REQUIRED_FIELDS = ('server_id', 'pod_name')
+
+
 @app.route('/delete', methods=['POST'])
 def delete_pod():
     """
@@ -352,19 +407,20 @@ def delete_pod():
         description: Server error
     """
     try:
-        req = request.json
-        if req is None:
-            return jsonify({'error': 'Invalid JSON data'}), 400
+        req = request.get_json(silent=True)
+        if not isinstance(req, dict):
+            return json_bytes_response(_INVALID_JSON_BODY, 400)
         
         # Get server_id and pod_name from request
-        server_id = req.get('server_id')
-        pod_name = req.get('pod_name')
-        
-        if not server_id:
-            return jsonify({'error': 'server_id is required'}), 400
+        missing = next((field for field in _DELETE_REQUIRED_FIELDS if not req.get(field)), None)
+        if missing:
+            return jsonify({'error': f'{missing} is required'}), 400
         
-        if not pod_name:
-            return jsonify({'error': 'pod_name is required'}), 400
+        server_id = req['server_id']
+        pod_name = req['pod_name']
+        # Same rule as /create, so names that could never have been created are refused early
+        if not is_valid_pod_name(pod_name):
+            return json_bytes_response(_INVALID_POD_NAME_BODY, 400)
         
         # Delete pod using server manager
         result = server_manager.delete_pod(server_id, pod_name)
@@ -375,12 +431,15 @@ def delete_pod():
             else:
                 return jsonify(result), 500
         else:
-            return jsonify({'type': 'success', 'message': 'Pod deleted'}), 200
+            return json_bytes_response(_POD_DELETED_BODY)
             
     except Exception as e:
         return jsonify({'error': 'Server error', 'details': str(e)}), 500
 
 
+_RESOURCES_VALID_PAYLOAD = {'type': 'success', 'message': 'Azure VM resource allocation is valid'}
+
+
 @app.route('/resource-validation', methods=['GET'])
 def resource_validation():
     """
@@ -409,40 +468,60 @@ def resource_validation():
         examples:
           application/json:
             error: "Server error"
-            details: "<details>"
     """
-    try:
-        # Use server manager for all environments (static data only)
-        servers = server_manager.get_all_servers_static()
-        
-        errors = []
-        for server in servers:
-            total = server['resources']['total']
-            available = server['resources']['available']
-            # Check available <= total for each resource
-            for key in total:
-                if available.get(key, 0) > total.get(key, 0):
-                    errors.append(f"Server {server['name']}: available {key} > total {key}")
-            # Check sum of pod resources <= total for each resource
-            pod_sums = {}
-            for pod in server.get('pods', []):
-                requested = pod.get('requested') if isinstance(pod, dict) else None
-                if isinstance(requested, dict):
-                    for k, v in requested.items():
-                        pod_sums[k] = pod_sums.get(k, 0) + v
-            for key in total:
-                if pod_sums.get(key, 0) > total.get(key, 0):
-                    errors.append(f"Server {server['name']}: sum of pod {key} > total {key}")
-        if errors:
-            return jsonify({
-                'type': 'error',
-                'message': 'Resource validation failed. See details below.',
-                'details': errors
-            }), 400
-        else:
-            return jsonify({'type': 'success', 'message': 'Azure VM resource allocation is valid'}), 200
-    except Exception as e:
-        return jsonify({'error': f'Server error: {str(e)}'}), 500
+    # Use server manager for all environments (static data only)
+    servers = server_manager.get_all_servers_static()
+
+    errors = []
+    for server in servers:
+        errors.extend(validate_server_resources(server))
+    if errors:
+        return jsonify({
+            'type': 'error',
+            'message': 'Resource validation failed. See details below.',
+            'details': errors
+        }), 400
+    else:
+        # Constant body: encoded and hashed once, then served with its ETag
+        return cached_conditional_jsonify('resource_validation', None, lambda: _RESOURCES_VALID_PAYLOAD)
+
+
+def _health_body_prefix(healthy, cluster_status):
+    """
+    Encode the /health body for one outcome up to its timestamp. Keys are
+    sorted, so "timestamp" is always the last field and is appended per request.
+    """
+    if healthy:
+        payload = {'status': 'healthy', 'cluster_status': cluster_status}
+    else:
+        payload = {
+            'status': 'unhealthy',
+            'cluster_status': cluster_status,
+            'error': 'Kubernetes cluster health check failed'
+        }
+    return prebuilt_json(payload)[:-len(b'}\n')] + b',"timestamp":'
+
+
+# /health body prefixes for every (healthy, cluster status) pair, built once
+_HEALTH_BODY_PREFIXES = {
+    (healthy, status.value): _health_body_prefix(healthy, status.value)
+    for status in ClusterStatus
+    for healthy in (True, False)
+}
+
+# (epoch second, encoded ISO timestamp) reused by probes within the same second
+_health_timestamp = (0, b'')
+
+
+def _health_timestamp_json():
+    """Current time as an encoded JSON string, formatted at most once per second."""
+    global _health_timestamp
+    second = int(time.time())
+    cached_second, encoded = _health_timestamp
+    if second != cached_second:
+        encoded = orjson.dumps(datetime.fromtimestamp(second))
+        _health_timestamp = (second, encoded)
+    return encoded
 
 
 @app.route('/health', methods=['GET'])
@@ -467,28 +546,20 @@ def health_check():
             error: "Health check failed"
     """
     try:
-        # Force a health check
-        health_data = health_monitor.force_health_check()
+        # Latest monitoring result; probes the cluster only when monitoring is not running
+        healthy, health_data = health_monitor.get_health_snapshot()
         cluster_status = health_data['cluster_status']['status']
         
-        if health_monitor.is_healthy():
-            return jsonify({
-                'status': 'healthy',
-                'cluster_status': cluster_status,
-                'timestamp': datetime.now().isoformat()
-            }), 200
-        else:
-            return jsonify({
-                'status': 'unhealthy',
-                'cluster_status': cluster_status,
-                'error': 'Kubernetes cluster health check failed',
-                'timestamp': datetime.now().isoformat()
-            }), 500
+        prefix = _HEALTH_BODY_PREFIXES.get((healthy, cluster_status))
+        if prefix is None:
+            prefix = _health_body_prefix(healthy, cluster_status)
+        body = prefix + _health_timestamp_json() + b'}\n'
+        return json_bytes_response(body, 200 if healthy else 500)
     except Exception as e:
         return jsonify({
             'status': 'unhealthy',
             'error': f'Health check failed: {str(e)}',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now()
         }), 500
 
 
@@ -514,11 +585,11 @@ def detailed_health_check():
     """
     try:
         health_data = health_monitor.get_detailed_health()
-        return jsonify(health_data), 200
+        return conditional_jsonify(health_data, max_age=ResponseLimits.HEALTH_MAX_AGE)
     except Exception as e:
         return jsonify({
             'error': f'Detailed health check failed: {str(e)}',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now()
         }), 500
 
 
@@ -545,5 +616,6 @@ if __name__ == '__main__':
     # Get port from configuration
     port = Ports.get_backend_port()
     
-    # Start Flask app
-    app.run(debug=True, port=port)
+    # Start Flask app (without debug mode: its reloader runs a second process
+    # with its own monitoring threads; use main.py or start.sh for production)
+    app.run(port=port)
@@ -7,8 +7,9 @@ import threading
 import time
 from datetime import datetime
 from typing import Dict, List
-import os
-import json
+
+from config.constants import FilePaths
+from config.utils import load_json_file, save_json_file
 
 class BackgroundRefreshService:
     """Background service for refreshing live data from Kubernetes clusters."""
@@ -61,9 +62,8 @@ class BackgroundRefreshService:
     def _load_refresh_config(self):
         """Load refresh configuration from master.json."""
         try:
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config_path = FilePaths.MASTER_CONFIG
+            config = load_json_file(config_path, cached=True)
             
             refresh_config = config.get('config', {})
             self.auto_refresh_enabled = refresh_config.get('auto_refresh_enabled', True)
@@ -87,31 +87,26 @@ class BackgroundRefreshService:
         """Refresh live data for all configured servers."""
         try:
             from core.server_manager import server_manager
-            from core.server_configuration_api import _fetch_and_update_live_data
+            from core.server_configuration_api import _refresh_live_data
             
             # Reload server manager to ensure fresh configuration
             server_manager.reload_config()
             
-            # Get all configured servers
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            # Get all configured servers (read-only: reuse the parsed copy while unchanged)
+            config_path = FilePaths.MASTER_CONFIG
+            config = load_json_file(config_path, cached=True)
             
             servers = config.get('servers', [])
             successful_refreshes = 0
             
-            for server in servers:
+            # Fetched per server, written to master.json once at the end
+            for server, result in _refresh_live_data([s for s in servers if s.get('id')]):
                 server_id = server.get('id')
-                if server_id:
-                    try:
-                        result = _fetch_and_update_live_data(server_id)
-                        if result.get('type') == 'success':
-                            successful_refreshes += 1
-                            print(f"✅ Refreshed server: {server_id}")
-                        else:
-                            print(f"⚠️  Failed to refresh server {server_id}: {result.get('message')}")
-                    except Exception as e:
-                        print(f"❌ Error refreshing server {server_id}: {e}")
+                if result.get('type') == 'success':
+                    successful_refreshes += 1
+                    print(f"✅ Refreshed server: {server_id}")
+                else:
+                    print(f"⚠️  Failed to refresh server {server_id}: {result.get('message')}")
             
             # Update last refresh timestamp
             self._update_last_refresh()
@@ -124,17 +119,15 @@ class BackgroundRefreshService:
     def _update_last_refresh(self):
         """Update the last refresh timestamp in master.json."""
         try:
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config_path = FilePaths.MASTER_CONFIG
+            config = load_json_file(config_path)
             
             if 'config' not in config:
                 config['config'] = {}
             
             config['config']['last_live_refresh'] = datetime.now().isoformat()
             
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            save_json_file(config_path, config)
                 
         except Exception as e:
             print(f"⚠️  Failed to update last refresh timestamp: {e}")
@@ -6,7 +6,8 @@ Provides comprehensive cluster health checking and status monitoring.
 import time
 import threading
 import logging
-from typing import Dict, List, Optional, Any
+import orjson
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from kubernetes import client
 from kubernetes.client.rest import ApiException
@@ -14,11 +15,16 @@ from kubernetes.client.rest import ApiException
 from config.config import Config
 from config.constants import (
     ClusterStatus, HealthStatus, HealthCheckType, HealthCheckConfig,
-    ErrorMessages, SuccessMessages, LogLevels
+    ErrorMessages, SuccessMessages, LogLevels, FilePaths, KubernetesConstants
 )
+from config.utils import load_json_file
 from providers.cloud_kubernetes_provider import CloudKubernetesProvider
 
 
+# Cluster states that still count as healthy for /health
+_HEALTHY_STATUSES = frozenset({ClusterStatus.HEALTHY, ClusterStatus.DEGRADED})
+
+
 class HealthCheckResult:
     """Result of a health check."""
     
@@ -29,16 +35,19 @@ class HealthCheckResult:
         self.details = details
         self.timestamp = timestamp or datetime.now()
         self.latency_ms = latency_ms
+        self._dict = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'check_type': self.check_type,
-            'status': self.status,
-            'details': self.details,
-            'timestamp': self.timestamp.isoformat(),
-            'latency_ms': self.latency_ms
-        }
+        """Convert to dictionary for JSON serialization (built once; results are not modified)."""
+        if self._dict is None:
+            self._dict = {
+                'check_type': self.check_type,
+                'status': self.status,
+                'details': self.details,
+                'timestamp': self.timestamp.isoformat(),
+                'latency_ms': self.latency_ms
+            }
+        return self._dict
 
 
 class ClusterHealthMonitor:
@@ -54,6 +63,13 @@ class ClusterHealthMonitor:
         self._error_count = 0
         self._consecutive_failures = 0
         
+        # Forced checks: one in flight at a time, result shared as (data, expires_at)
+        self._forced_check_lock = threading.Lock()
+        self._forced_check_result = None
+        
+        # Latest monitoring-thread results, replaced whole after each cycle
+        self._snapshot = None
+        
         # Setup logging
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
@@ -80,6 +96,7 @@ class ClusterHealthMonitor:
         while self._monitoring:
             try:
                 self._perform_health_checks()
+                self._snapshot = (self.is_healthy(), self.get_detailed_health())
                 time.sleep(HealthCheckConfig.CLUSTER_HEALTH_INTERVAL)
             except Exception as e:
                 self.logger.error(f"Error in health monitoring loop: {e}")
@@ -87,7 +104,7 @@ class ClusterHealthMonitor:
     
     def _perform_health_checks(self) -> None:
         """Perform all health checks."""
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Check cluster connectivity
         connectivity_result = self._check_cluster_connectivity()
@@ -115,7 +132,7 @@ class ClusterHealthMonitor:
         
         # Update timing
         self._last_check_time = datetime.now()
-        self._last_health_check = time.time() - start_time
+        self._last_health_check = time.monotonic() - start_time
         
         # Reset error count if healthy
         if self._cluster_status == ClusterStatus.HEALTHY:
@@ -123,18 +140,15 @@ class ClusterHealthMonitor:
     
     def _check_cluster_connectivity(self) -> HealthCheckResult:
         """Check if we can connect to the Kubernetes cluster using the same client as pod operations."""
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # Create a temporary provider to test connection
             # This uses the same configuration as the pod operations
-            import json
-            import os
             
             # Load master.json to get server configuration
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-            with open(config_path, 'r') as f:
-                master_config = json.load(f)
+            config_path = FilePaths.MASTER_CONFIG
+            master_config = load_json_file(config_path, cached=True)
             
             # Find the first Kubernetes server
             kubernetes_servers = [s for s in master_config.get('servers', []) 
@@ -157,7 +171,7 @@ class ClusterHealthMonitor:
             provider._ensure_initialized()
             provider.core_v1.list_namespace()
             
-            latency = int((time.time() - start_time) * 1000)
+            latency = int((time.monotonic() - start_time) * 1000)
             return HealthCheckResult(
                 check_type=HealthCheckType.CLUSTER_CONNECTIVITY.value,
                 status=HealthStatus.PASS.value,
@@ -166,7 +180,7 @@ class ClusterHealthMonitor:
             )
             
         except Exception as e:
-            latency = int((time.time() - start_time) * 1000)
+            latency = int((time.monotonic() - start_time) * 1000)
             error_details = f"{ErrorMessages.K8S_CONNECTION_ERROR}: {str(e)}"
             
             return HealthCheckResult(
@@ -178,18 +192,15 @@ class ClusterHealthMonitor:
     
     def _check_api_server(self) -> HealthCheckResult:
         """Check API server responsiveness."""
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # Create a temporary provider to test connection
             # This uses the same configuration as the pod operations
-            import json
-            import os
             
             # Load master.json to get server configuration
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-            with open(config_path, 'r') as f:
-                master_config = json.load(f)
+            config_path = FilePaths.MASTER_CONFIG
+            master_config = load_json_file(config_path, cached=True)
             
             # Find the first Kubernetes server
             kubernetes_servers = [s for s in master_config.get('servers', []) 
@@ -212,7 +223,7 @@ class ClusterHealthMonitor:
             provider._ensure_initialized()
             api_resources = provider.core_v1.get_api_resources()
             
-            latency = int((time.time() - start_time) * 1000)
+            latency = int((time.monotonic() - start_time) * 1000)
             
             if latency > HealthCheckConfig.MAX_API_LATENCY_MS:
                 return HealthCheckResult(
@@ -230,7 +241,7 @@ class ClusterHealthMonitor:
             )
             
         except Exception as e:
-            latency = int((time.time() - start_time) * 1000)
+            latency = int((time.monotonic() - start_time) * 1000)
             return HealthCheckResult(
                 check_type=HealthCheckType.API_SERVER.value,
                 status=HealthStatus.FAIL.value,
@@ -240,18 +251,15 @@ class ClusterHealthMonitor:
     
     def _check_node_status(self) -> HealthCheckResult:
         """Check the status of all nodes in the cluster."""
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # Create a temporary provider to test connection
             # This uses the same configuration as the pod operations
-            import json
-            import os
             
             # Load master.json to get server configuration
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-            with open(config_path, 'r') as f:
-                master_config = json.load(f)
+            config_path = FilePaths.MASTER_CONFIG
+            master_config = load_json_file(config_path, cached=True)
             
             # Find the first Kubernetes server
             kubernetes_servers = [s for s in master_config.get('servers', []) 
@@ -272,7 +280,9 @@ class ClusterHealthMonitor:
             # Create a temporary provider with the same configuration
             provider = CloudKubernetesProvider(server)
             provider._ensure_initialized()
-            nodes = provider.core_v1.list_node()
+            nodes = provider.core_v1.list_node(
+                resource_version=KubernetesConstants.CACHED_LIST_RESOURCE_VERSION
+            )
             
             total_nodes = len(nodes.items)
             ready_nodes = 0
@@ -287,7 +297,7 @@ class ClusterHealthMonitor:
                             failed_nodes.append(node.metadata.name)
                         break
             
-            latency = int((time.time() - start_time) * 1000)
+            latency = int((time.monotonic() - start_time) * 1000)
             
             if failed_nodes:
                 if len(failed_nodes) > HealthCheckConfig.MAX_FAILED_NODES:
@@ -313,7 +323,7 @@ class ClusterHealthMonitor:
             )
             
         except Exception as e:
-            latency = int((time.time() - start_time) * 1000)
+            latency = int((time.monotonic() - start_time) * 1000)
             return HealthCheckResult(
                 check_type=HealthCheckType.NODE_STATUS.value,
                 status=HealthStatus.FAIL.value,
@@ -323,18 +333,15 @@ class ClusterHealthMonitor:
     
     def _check_pod_status(self) -> HealthCheckResult:
         """Check the status of pods in the cluster."""
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # Create a temporary provider to test connection
             # This uses the same configuration as the pod operations
-            import json
-            import os
             
             # Load master.json to get server configuration
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-            with open(config_path, 'r') as f:
-                master_config = json.load(f)
+            config_path = FilePaths.MASTER_CONFIG
+            master_config = load_json_file(config_path, cached=True)
             
             # Find the first Kubernetes server
             kubernetes_servers = [s for s in master_config.get('servers', []) 
@@ -356,20 +363,28 @@ class ClusterHealthMonitor:
             provider = CloudKubernetesProvider(server)
             provider._ensure_initialized()
             
-            # Get pods from all namespaces
-            pods = provider.core_v1.list_pod_for_all_namespaces()
+            # Get pods from all namespaces as raw JSON: only name and phase are
+            # read, so skip building a V1Pod model object for every pod
+            response = provider.core_v1.list_pod_for_all_namespaces(
+                resource_version=KubernetesConstants.CACHED_LIST_RESOURCE_VERSION,
+                _preload_content=False
+            )
+            pods = orjson.loads(response.data).get('items') or []
             
-            total_pods = len(pods.items)
+            total_pods = len(pods)
             failed_pods = []
             pending_pods = []
             
-            for pod in pods.items:
-                if pod.status.phase == "Failed":
-                    failed_pods.append(f"{pod.metadata.namespace}/{pod.metadata.name}")
-                elif pod.status.phase == "Pending":
-                    pending_pods.append(f"{pod.metadata.namespace}/{pod.metadata.name}")
+            for pod in pods:
+                phase = pod.get('status', {}).get('phase')
+                if phase == "Failed":
+                    metadata = pod.get('metadata', {})
+                    failed_pods.append(f"{metadata.get('namespace')}/{metadata.get('name')}")
+                elif phase == "Pending":
+                    metadata = pod.get('metadata', {})
+                    pending_pods.append(f"{metadata.get('namespace')}/{metadata.get('name')}")
             
-            latency = int((time.time() - start_time) * 1000)
+            latency = int((time.monotonic() - start_time) * 1000)
             
             failed_percentage = (len(failed_pods) / total_pods * 100) if total_pods > 0 else 0
             
@@ -402,7 +417,7 @@ class ClusterHealthMonitor:
             )
             
         except Exception as e:
-            latency = int((time.time() - start_time) * 1000)
+            latency = int((time.monotonic() - start_time) * 1000)
             return HealthCheckResult(
                 check_type=HealthCheckType.POD_STATUS.value,
                 status=HealthStatus.FAIL.value,
@@ -450,12 +465,45 @@ class ClusterHealthMonitor:
     
     def is_healthy(self) -> bool:
         """Check if cluster is healthy."""
-        return self._cluster_status in [ClusterStatus.HEALTHY, ClusterStatus.DEGRADED]
+        return self._cluster_status in _HEALTHY_STATUSES
+    
+    def get_health_snapshot(self) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Health for /health as (healthy, detailed health), without probing the
+        cluster per request.
+        
+        While monitoring is running this is the result of its latest cycle;
+        otherwise (or before that cycle finishes) a forced check is run.
+        """
+        snapshot = self._snapshot
+        if self._monitoring and snapshot:
+            return snapshot
+        
+        health_data = self.force_health_check()
+        return self.is_healthy(), health_data
     
     def force_health_check(self) -> Dict[str, Any]:
-        """Force an immediate health check."""
-        self._perform_health_checks()
-        return self.get_detailed_health()
+        """
+        Force an immediate health check.
+        
+        Concurrent callers are coalesced onto a single in-flight check, and its
+        result is reused for HealthCheckConfig.FORCED_CHECK_TTL seconds so probe
+        frequency does not translate into Kubernetes API load.
+        """
+        cached = self._forced_check_result
+        if cached and time.monotonic() < cached[1]:
+            return cached[0]
+        
+        with self._forced_check_lock:
+            # Another caller may have finished a check while we waited
+            cached = self._forced_check_result
+            if cached and time.monotonic() < cached[1]:
+                return cached[0]
+            
+            self._perform_health_checks()
+            result = self.get_detailed_health()
+            self._forced_check_result = (result, time.monotonic() + HealthCheckConfig.FORCED_CHECK_TTL)
+            return result
 
 
 # Global health monitor instance
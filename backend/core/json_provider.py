@@ -0,0 +1,217 @@
+"""
+JSON Provider Module
+Flask JSON provider backed by orjson for faster request/response (de)serialization.
+"""
+
+import gzip
+import hashlib
+
+import orjson
+import threading
+
+from flask import Response, jsonify, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+from config.constants import ResponseLimits
+
+
+# Match jsonify's output (sorted keys, non-str keys allowed)
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# Response types worth gzipping (repetitive keys compress well)
+_COMPRESSIBLE_MIMETYPES = frozenset({'application/json', NDJSON_MIMETYPE, 'text/html'})
+
+# Encoded response bodies keyed by name -> (version, body bytes, etag, gzipped body or None)
+_body_cache = {}
+_body_cache_lock = threading.Lock()
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that uses orjson instead of the stdlib json module.
+    
+    datetime values serialize natively to ISO 8601 (same text as isoformat()),
+    so handlers can return them without converting first.
+    """
+
+    def _options(self, sort_keys=None, indent=None) -> int:
+        """Translate json.dumps-style arguments into orjson option flags."""
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys if sort_keys is None else sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize obj to a JSON string."""
+        option = self._options(kwargs.get('sort_keys'), kwargs.get('indent'))
+        return orjson.dumps(obj, default=str, option=option).decode()
+
+    def response(self, *args, **kwargs):
+        """
+        Build a JSON response straight from orjson's bytes, skipping the
+        str decode/re-encode round trip of the default implementation.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        option = self._options(indent=pretty) | orjson.OPT_APPEND_NEWLINE
+        return self._app.response_class(
+            orjson.dumps(obj, default=str, option=option), mimetype=self.mimetype
+        )
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
+
+
+def conditional_jsonify(payload, max_age=0):
+    """
+    jsonify payload with a content-hash ETag and answer 304 Not Modified
+    when the client's If-None-Match already matches it.
+    
+    max_age > 0 lets clients and proxies reuse the body for that many seconds;
+    0 sends no-cache so every reuse is revalidated against the ETag.
+    """
+    response = jsonify(payload)
+    return _make_conditional(response, _body_etag(response.get_data()), max_age)
+
+
+def cached_conditional_jsonify(name, version, build_payload, max_age=0):
+    """
+    Like conditional_jsonify, but keep the encoded body, its ETag and (when
+    large enough) its gzipped form, and reuse them until version changes, so
+    unchanged data is not re-serialized, re-hashed or re-compressed on every poll.
+    
+    Args:
+        name (str): Cache slot (one per endpoint)
+        version: Hashable marker that changes whenever the payload would
+        build_payload (callable): Returns the payload on a cache miss
+        max_age (int): As for conditional_jsonify
+    """
+    entry = _body_cache.get(name)
+    if entry is None or entry[0] != version:
+        body = jsonify(build_payload()).get_data()
+        gzipped = _gzip(body) if len(body) >= ResponseLimits.COMPRESS_MIN_SIZE else None
+        entry = (version, body, _body_etag(body), gzipped)
+        with _body_cache_lock:
+            _body_cache[name] = entry
+    
+    if entry[3] is not None and _accepts_gzip():
+        # Already compressed: compress_response leaves Content-Encoding responses alone
+        response = Response(entry[3], mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+        return _make_conditional(response, entry[2], max_age, weak=True)
+    
+    response = Response(entry[1], mimetype='application/json')
+    return _make_conditional(response, entry[2], max_age)
+
+
+def _body_etag(body):
+    """Content hash of an encoded response body."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _make_conditional(response, etag, max_age, weak=False):
+    """Attach ETag and Cache-Control headers and answer 304 when the client is current."""
+    response.set_etag(etag, weak=weak)
+    if max_age:
+        response.cache_control.max_age = max_age
+    else:
+        response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def prebuilt_json(payload):
+    """
+    Serialize a constant payload once, at import time.
+    
+    Returns bytes identical to jsonify's output, to be served per request with
+    json_bytes_response (Response objects themselves are not shared, since
+    after_request hooks such as CORS add headers to them).
+    """
+    return orjson.dumps(payload, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+
+
+def json_bytes_response(body, status=200):
+    """Wrap pre-serialized JSON bytes in a fresh response."""
+    return Response(body, status=status, mimetype='application/json')
+
+
+def stream_json_array(items):
+    """
+    Stream a list as a JSON array, serializing one element per chunk so peak
+    memory is a single element rather than the whole body.
+    """
+    def generate():
+        yield b'['
+        for index, item in enumerate(items):
+            if index:
+                yield b','
+            yield orjson.dumps(item, default=str, option=_ORJSON_OPTIONS)
+        yield b']\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+def wants_ndjson():
+    """True when the client asked for newline-delimited JSON (Accept: application/x-ndjson)."""
+    return request.accept_mimetypes.best_match(
+        ['application/json', NDJSON_MIMETYPE]
+    ) == NDJSON_MIMETYPE
+
+
+def stream_ndjson(items):
+    """
+    Stream an iterable as newline-delimited JSON, writing each item as soon as
+    it is produced so clients see progress before the whole operation ends.
+    """
+    def generate():
+        for item in items:
+            yield orjson.dumps(item, default=str, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+
+def compress_response(response):
+    """
+    after_request hook: gzip JSON and HTML bodies for clients that accept it.
+    
+    Streamed, small and non-200 responses are sent as they are. A strong ETag
+    is downgraded to weak, so the gzipped and plain forms still match the same
+    If-None-Match while not claiming to be byte-identical.
+    """
+    if (response.status_code != 200
+            or response.is_streamed
+            or response.direct_passthrough
+            or response.mimetype not in _COMPRESSIBLE_MIMETYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    if not _accepts_gzip():
+        return response
+    
+    body = response.get_data()
+    if len(body) < ResponseLimits.COMPRESS_MIN_SIZE:
+        return response
+    
+    response.set_data(_gzip(body))
+    response.headers['Content-Encoding'] = 'gzip'
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def _accepts_gzip():
+    """True when the current request's Accept-Encoding allows gzip."""
+    return bool(request.accept_encodings['gzip'])
+
+
+def _gzip(body):
+    """gzip a response body (mtime 0, so equal bodies compress to equal bytes)."""
+    return gzip.compress(body, compresslevel=ResponseLimits.COMPRESS_LEVEL, mtime=0)
@@ -10,6 +10,7 @@ import yaml
 from typing import Optional, Dict, Any
 from kubernetes import client, config as k8s_config
 from kubernetes.client.rest import ApiException
+from urllib3.util.retry import Retry
 
 from config.config import Config
 from config.constants import (
@@ -21,6 +22,7 @@ class KubernetesClient:
     """Kubernetes client with environment-aware authentication."""
     
     def __init__(self):
+        self.api_client = None
         self.core_v1 = None
         self.apps_v1 = None
         self._initialized = False
@@ -39,8 +41,17 @@ class KubernetesClient:
         else:
             raise ValueError(f"Unsupported authentication method: {auth_method}")
         
-        self.core_v1 = client.CoreV1Api()
-        self.apps_v1 = client.AppsV1Api()
+        # One pooled ApiClient shared by every API group, so connections are
+        # reused across calls instead of each API opening its own pool
+        configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = KubernetesConstants.CONNECTION_POOL_MAXSIZE
+        configuration.retries = Retry(
+            total=KubernetesConstants.REQUEST_RETRIES, connect=0,
+            backoff_factor=KubernetesConstants.REQUEST_RETRY_BACKOFF
+        )
+        self.api_client = client.ApiClient(configuration)
+        self.core_v1 = client.CoreV1Api(self.api_client)
+        self.apps_v1 = client.AppsV1Api(self.api_client)
         self._initialized = True
     
     def _init_local_kubeconfig(self) -> None:
@@ -3,39 +3,98 @@ Server Configuration API Module
 Handles server configuration endpoints.
 """
 
-import os
-import json
 import base64
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from flask import Blueprint, request, jsonify
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from config.constants import FilePaths, ResponseLimits
 from config.types import (
     MasterConfig, ServerConfig, ServerConfigurationInput,
-    create_default_server_config, validate_master_config,
-    validate_server_config
+    create_default_master_config, create_default_server_config,
+    validate_master_config, validate_server_config
 )
+from config.utils import get_file_signature, load_json_file, save_json_file
+from providers.cloud_kubernetes_provider import CloudKubernetesProvider
+from core.json_provider import (
+    cached_conditional_jsonify, prebuilt_json, json_bytes_response, stream_ndjson, wants_ndjson
+)
+
+# Pool for per-server live data fetches during a refresh; each call is network-bound
+_LIVE_DATA_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='live-data')
+
+# Constant response bodies, serialized once
+_HEALTHY_BODY = prebuilt_json({
+    "type": "success",
+    "code": "HEALTHY",
+    "message": "Server configuration API is running"
+})
+_NO_DATA_BODY = prebuilt_json({"type": "error", "code": "INVALID_DATA", "message": "No data provided"})
+_NO_SERVER_DETAILS_BODY = prebuilt_json({"status": "error", "message": "No server details provided."})
+_SERVER_ID_REQUIRED_BODY = prebuilt_json({"status": "error", "message": "Server ID is required."})
+_REFRESH_STARTED_BODY = prebuilt_json({
+    "type": "success",
+    "code": "BACKGROUND_REFRESH_STARTED",
+    "message": "Background refresh service started successfully"
+})
+_REFRESH_STOPPED_BODY = prebuilt_json({
+    "type": "success",
+    "code": "BACKGROUND_REFRESH_STOPPED",
+    "message": "Background refresh service stopped successfully"
+})
+_NO_BODY_BODY = prebuilt_json({"type": "error", "code": "INVALID_REQUEST", "message": "Request body is required"})
+_MISSING_CREDENTIALS_BODY = prebuilt_json({
+    "type": "error",
+    "code": "MISSING_CREDENTIALS",
+    "message": "Both username and password are required"
+})
 
 # Create blueprint
 server_config_bp = Blueprint('server_config', __name__, url_prefix='/api/server-config')
 
-def _load_master_config() -> MasterConfig:
-    """Load master configuration from file."""
+# Required /configure fields (type and environment are auto-set); the tuple keeps error order
+_CONFIGURE_REQUIRED_FIELDS = ('name', 'host', 'username', 'password')
+_CONFIGURE_REQUIRED_SET = frozenset(_CONFIGURE_REQUIRED_FIELDS)
+
+def _load_master_config(cached: bool = False) -> MasterConfig:
+    """Load master configuration from file (pass cached=True for read-only access)."""
     try:
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
-            return validate_master_config(config_data)
+        config_path = FilePaths.MASTER_CONFIG
+        config_data = load_json_file(config_path, cached=cached)
+        return validate_master_config(config_data)
     except Exception as e:
         print(f"Error loading master config: {e}")
         return create_default_master_config()
 
+def _master_config_response(name: str, build_payload):
+    """
+    Serve a payload built only from master.json with an ETag, re-encoding it
+    only after the file changes so polling clients mostly get 304s.
+    
+    Args:
+        name: Cache slot for this endpoint
+        build_payload: Returns the response payload on a cache miss
+    """
+    version = get_file_signature(FilePaths.MASTER_CONFIG)
+    return cached_conditional_jsonify(
+        f"server_config.{name}", version, build_payload, max_age=ResponseLimits.SERVERS_MAX_AGE
+    )
+
+def _get_json_object() -> Optional[Dict]:
+    """Return the request body if it is a JSON object, else None (never raises)."""
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else None
+
+def _error_response(code: str, message: str, status: int):
+    """Build the blueprint's standard {"type": "error", "code", "message"} response."""
+    return jsonify({"type": "error", "code": code, "message": message}), status
+
 def _save_master_config(config: MasterConfig):
     """Save master configuration to file."""
     try:
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        config_path = FilePaths.MASTER_CONFIG
+        save_json_file(config_path, config)
         print("✅ Master configuration updated successfully")
     except Exception as e:
         print(f"Error saving master config: {e}")
@@ -132,11 +191,85 @@ def _generate_kubeconfig_with_credentials(host: str, port: int, username: str, p
         ]
     }
 
+def _fetch_live_data(server: ServerConfig) -> Tuple[Dict, Dict]:
+    """
+    Fetch live pod data for one configured server without writing master.json.
+    
+    Returns:
+        (result, updates): the API result and the fields to merge into the
+        server's master.json entry
+    """
+    from core.server_manager import server_manager
+    
+    server_id = server.get('id')
+    live_server_data = server_manager.get_server_with_pods(server_id)
+    metadata = {
+        **server.get('metadata', {}),
+        "last_updated": datetime.now().isoformat(),
+        "live_data_fresh": bool(live_server_data)
+    }
+    
+    if live_server_data:
+        # Update the server with live data
+        updates = {
+            "pods": live_server_data.get('pods', []),
+            "resources": live_server_data.get('resources', {}),
+            "status": live_server_data.get('status', 'configured'),
+            "metadata": metadata
+        }
+        return {
+            "type": "success",
+            "code": "LIVE_DATA_UPDATED",
+            "message": f"Live data updated for server {server_id}",
+            "data": {
+                "pods_count": len(updates["pods"]),
+                "status": updates["status"]
+            }
+        }, updates
+    
+    # No live data available: only update metadata, preserve existing live data
+    return {
+        "type": "warning",
+        "code": "NO_LIVE_DATA",
+        "message": f"Server {server_id} configured but no live data available (preserving existing data)",
+        "data": {
+            "pods_count": len(server.get('pods', [])),
+            "status": server.get('status', 'configured')
+        }
+    }, {"metadata": metadata}
+
+def _save_live_data_updates(updates_by_id: Dict[str, Dict]):
+    """
+    Merge fetched fields into a fresh read of master.json and write it once.
+    
+    Re-reading just before the write keeps changes made while the live data
+    was being fetched (e.g. pod creation) instead of overwriting them.
+    """
+    config = _load_master_config()
+    applied = False
+    for server in config.get('servers', []):
+        updates = updates_by_id.get(server.get('id'))
+        if updates:
+            server.update(updates)
+            applied = True
+    
+    # Nothing matched (servers removed, or the file could not be read): keep the file as is
+    if applied:
+        _save_master_config(config)
+
+def _live_data_error(e: Exception) -> Dict:
+    """Result for a server whose live data could not be fetched or saved."""
+    return {
+        "type": "error",
+        "code": "LIVE_DATA_FAILED",
+        "message": f"Failed to fetch live data: {str(e)}"
+    }
+
 def _fetch_and_update_live_data(server_id: str) -> Dict:
     """Fetch live pod data from a configured server and update master.json."""
     try:
         # Get the server configuration
-        config = _load_master_config()
+        config = _load_master_config(cached=True)
         server: Optional[ServerConfig] = None
         for s in config.get('servers', []):
             if s.get('id') == server_id:
@@ -150,74 +283,47 @@ def _fetch_and_update_live_data(server_id: str) -> Dict:
                 "message": f"Server {server_id} not found in configuration"
             }
         
-        # Try to get live data from the server manager
         from core.server_manager import server_manager
         server_manager.reload_config()  # Ensure fresh config
         
-        live_server_data = server_manager.get_server_with_pods(server_id)
-        
-        if live_server_data:
-            # Update the server with live data
-            server.update({
-                "pods": live_server_data.get('pods', []),
-                "resources": live_server_data.get('resources', {}),
-                "status": live_server_data.get('status', 'configured'),
-                "metadata": {
-                    **server.get('metadata', {}),
-                    "last_updated": datetime.now().isoformat(),
-                    "live_data_fresh": True
-                }
-            })
-            
-            # Save updated config
-            _save_master_config(config)
-            
-            return {
-                "type": "success",
-                "code": "LIVE_DATA_UPDATED",
-                "message": f"Live data updated for server {server_id}",
-                "data": {
-                    "pods_count": len(live_server_data.get('pods', [])),
-                    "status": live_server_data.get('status', 'configured')
-                }
-            }
-        else:
-            # No live data available, but preserve existing data if available
-            existing_pods = server.get('pods', [])
-            existing_resources = server.get('resources', {})
-            
-            # Only update metadata, preserve existing live data
-            server.update({
-                "metadata": {
-                    **server.get('metadata', {}),
-                    "last_updated": datetime.now().isoformat(),
-                    "live_data_fresh": False
-                }
-            })
-            
-            _save_master_config(config)
-            
-            return {
-                "type": "warning",
-                "code": "NO_LIVE_DATA",
-                "message": f"Server {server_id} configured but no live data available (preserving existing data)",
-                "data": {
-                    "pods_count": len(existing_pods),
-                    "status": server.get('status', 'configured')
-                }
-            }
+        result, updates = _fetch_live_data(server)
+        _save_live_data_updates({server_id: updates})
+        return result
             
     except Exception as e:
-        return {
-            "type": "error",
-            "code": "LIVE_DATA_FAILED",
-            "message": f"Failed to fetch live data: {str(e)}"
-        }
+        return _live_data_error(e)
+
+def _refresh_live_data(servers: List[ServerConfig]) -> Iterator[Tuple[ServerConfig, Dict]]:
+    """
+    Fetch live data for several servers, yielding (server, result) as each one
+    completes, and write master.json once after the last instead of re-reading
+    and rewriting the whole file per server.
+    
+    Servers are fetched concurrently, so a refresh takes about as long as the
+    slowest cluster rather than the sum of all of them.
+    """
+    from core.server_manager import server_manager
+    server_manager.reload_config()  # Ensure fresh config once for the whole batch
+    
+    updates_by_id = {}
+    futures = {_LIVE_DATA_EXECUTOR.submit(_fetch_live_data, server): server for server in servers}
+    try:
+        for future in as_completed(futures):
+            server = futures[future]
+            try:
+                result, updates = future.result()
+                updates_by_id[server.get('id')] = updates
+            except Exception as e:
+                result = _live_data_error(e)
+            yield server, result
+    finally:
+        if updates_by_id:
+            _save_live_data_updates(updates_by_id)
 
 def _get_refresh_interval() -> int:
     """Get the refresh interval from master.json config."""
     try:
-        config = _load_master_config()
+        config = _load_master_config(cached=True)
         return config.get('config', {}).get('refresh_interval', 30)  # Default 30 seconds
     except Exception:
         return 30  # Fallback default
@@ -249,11 +355,7 @@ def health_check():
             code: "HEALTHY"
             message: "Server configuration API is running"
     """
-    return jsonify({
-        "type": "success",
-        "code": "HEALTHY",
-        "message": "Server configuration API is running"
-    })
+    return json_bytes_response(_HEALTHY_BODY)
 
 @server_config_bp.route('/reconnect', methods=['POST'])
 def reconnect_servers():
@@ -277,13 +379,13 @@ def reconnect_servers():
             message: "Failed to reconnect servers: <error_details>"
     """
     try:
-        data = request.get_json()
+        data = _get_json_object()
         if not data:
-            return jsonify({"status": "error", "message": "No server details provided."}), 400
+            return json_bytes_response(_NO_SERVER_DETAILS_BODY, 400)
         # Expect full server config in payload
         server_id = data.get('id') or data.get('server_id')
         if not server_id:
-            return jsonify({"status": "error", "message": "Server ID is required."}), 400
+            return json_bytes_response(_SERVER_ID_REQUIRED_BODY, 400)
         from core.server_manager import server_manager
         # Remove existing provider if present
         if server_id in server_manager.server_providers:
@@ -338,20 +440,18 @@ def get_config():
             code: "CONFIG_LOAD_FAILED"
             message: "Failed to load configuration: <error_details>"
     """
-    try:
-        config = _load_master_config()
-        return jsonify({
+    def build_payload():
+        return {
             "type": "success",
             "code": "CONFIG_RETRIEVED",
             "message": "Server configuration retrieved successfully",
-            "data": config
-        })
+            "data": _load_master_config(cached=True)
+        }
+    
+    try:
+        return _master_config_response('config', build_payload)
     except Exception as e:
-        return jsonify({
-            "type": "error",
-            "code": "CONFIG_LOAD_FAILED",
-            "message": f"Failed to load configuration: {str(e)}"
-        }), 500
+        return _error_response("CONFIG_LOAD_FAILED", f"Failed to load configuration: {str(e)}", 500)
 
 @server_config_bp.route('/config/refresh', methods=['GET'])
 def get_refresh_config():
@@ -383,8 +483,8 @@ def get_refresh_config():
             code: "REFRESH_CONFIG_FAILED"
             message: "Failed to get refresh configuration: <error_details>"
     """
-    try:
-        config = _load_master_config()
+    def build_payload():
+        config = _load_master_config(cached=True)
         refresh_config = config.get('config', {})
         
         # Get server-specific live refresh intervals
@@ -398,7 +498,7 @@ def get_refresh_config():
                     'live_refresh_interval': server.get('live_refresh_interval', 60)
                 }
         
-        return jsonify({
+        return {
             "type": "success",
             "code": "REFRESH_CONFIG_RETRIEVED",
             "message": "Refresh configuration retrieved",
@@ -409,13 +509,12 @@ def get_refresh_config():
                 "last_live_refresh": refresh_config.get('last_live_refresh'),
                 "server_refresh_intervals": server_refresh_intervals
             }
-        })
+        }
+    
+    try:
+        return _master_config_response('config_refresh', build_payload)
     except Exception as e:
-        return jsonify({
-            "type": "error",
-            "code": "REFRESH_CONFIG_FAILED",
-            "message": f"Failed to get refresh configuration: {str(e)}"
-        }), 500
+        return _error_response("REFRESH_CONFIG_FAILED", f"Failed to get refresh configuration: {str(e)}", 500)
 
 @server_config_bp.route('/config/refresh', methods=['POST'])
 def update_refresh_config():
@@ -464,13 +563,9 @@ def update_refresh_config():
             message: "Failed to update refresh configuration: <error_details>"
     """
     try:
-        data = request.json
+        data = _get_json_object()
         if not data:
-            return jsonify({
-                "type": "error",
-                "code": "INVALID_DATA",
-                "message": "No data provided"
-            }), 400
+            return json_bytes_response(_NO_DATA_BODY, 400)
         
         config = _load_master_config()
         if 'config' not in config:
@@ -483,13 +578,15 @@ def update_refresh_config():
             config['config']['auto_refresh_enabled'] = data['auto_refresh_enabled']
         
         # Update server-specific live refresh intervals
-        if 'server_refresh_intervals' in data:
-            for server_id, server_config in data['server_refresh_intervals'].items():
-                for server in config.get('servers', []):
-                    if server.get('id') == server_id:
-                        if 'live_refresh_interval' in server_config:
-                            server['live_refresh_interval'] = server_config['live_refresh_interval']
-                        break
+        server_refresh_intervals = data.get('server_refresh_intervals')
+        if isinstance(server_refresh_intervals, dict):
+            servers_by_id = {}
+            for server in config.get('servers', []):
+                servers_by_id.setdefault(server.get('id'), server)
+            for server_id, server_config in server_refresh_intervals.items():
+                server = servers_by_id.get(server_id)
+                if server is not None and isinstance(server_config, dict) and 'live_refresh_interval' in server_config:
+                    server['live_refresh_interval'] = server_config['live_refresh_interval']
         
         _save_master_config(config)
         
@@ -503,11 +600,7 @@ def update_refresh_config():
             }
         })
     except Exception as e:
-        return jsonify({
-            "type": "error",
-            "code": "REFRESH_CONFIG_UPDATE_FAILED",
-            "message": f"Failed to update refresh configuration: {str(e)}"
-        }), 500
+        return _error_response("REFRESH_CONFIG_UPDATE_FAILED", f"Failed to update refresh configuration: {str(e)}", 500)
 
 @server_config_bp.route('/configure', methods=['POST'])
 def configure_new_server():
@@ -574,23 +667,14 @@ def configure_new_server():
             message: "Failed to configure server: <error_details>"
     """
     try:
-        data: ServerConfigurationInput = request.json
+        data: ServerConfigurationInput = _get_json_object()
         if not data:
-            return jsonify({
-                "type": "error",
-                "code": "INVALID_DATA",
-                "message": "No data provided"
-            }), 400
+            return json_bytes_response(_NO_DATA_BODY, 400)
         
         # Validate required fields (type and environment are auto-set)
-        required_fields = ['name', 'host', 'username', 'password']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({
-                    "type": "error",
-                    "code": "MISSING_FIELD",
-                    "message": f"Missing required field: {field}"
-                }), 400
+        if not _CONFIGURE_REQUIRED_SET <= data.keys() or not all(data[f] for f in _CONFIGURE_REQUIRED_SET):
+            field = next(f for f in _CONFIGURE_REQUIRED_FIELDS if not data.get(f))
+            return _error_response("MISSING_FIELD", f"Missing required field: {field}", 400)
         
         # Auto-set type to 'kubernetes' and environment to 'live' since we only handle Kubernetes
         data['type'] = 'kubernetes'
@@ -671,11 +755,7 @@ def configure_new_server():
             })
         
     except Exception as e:
-        return jsonify({
-            "type": "error",
-            "code": "CONFIGURE_FAILED",
-            "message": f"Failed to configure server: {str(e)}"
-        }), 500
+        return _error_response("CONFIGURE_FAILED", f"Failed to configure server: {str(e)}", 500)
 
 @server_config_bp.route('/servers', methods=['GET'])
 def get_servers():
@@ -721,8 +801,8 @@ def get_servers():
             code: "SERVERS_RETRIEVAL_FAILED"
             message: "Failed to retrieve servers: <error_details>"
     """
-    try:
-        config = _load_master_config()
+    def build_payload():
+        config = _load_master_config(cached=True)
         servers = config.get('servers', [])
         
         # Return complete server data (including pods and resources)
@@ -746,41 +826,31 @@ def get_servers():
             }
             server_list.append(server_info)
         
-        return jsonify({
+        return {
             "type": "success",
             "code": "SERVERS_RETRIEVED",
             "message": f"Found {len(server_list)} servers",
             "data": server_list
-        })
-        
+        }
+    
+    try:
+        return _master_config_response('servers', build_payload)
     except Exception as e:
-        return jsonify({
-            "type": "error",
-            "code": "SERVERS_RETRIEVAL_FAILED",
-            "message": f"Failed to retrieve servers: {str(e)}"
-        }), 500
+        return _error_response("SERVERS_RETRIEVAL_FAILED", f"Failed to retrieve servers: {str(e)}", 500)
 
 @server_config_bp.route('/servers/<server_id>/kubeconfig', methods=['POST'])
 def update_kubeconfig(server_id: str):
     """Update kubeconfig for a specific server with credentials."""
     try:
-        data = request.get_json()
+        data = _get_json_object()
         if not data:
-            return jsonify({
-                "type": "error",
-                "code": "INVALID_REQUEST",
-                "message": "Request body is required"
-            }), 400
+            return json_bytes_response(_NO_BODY_BODY, 400)
         
         username = data.get('username')
         password = data.get('password')
         
         if not username or not password:
-            return jsonify({
-                "type": "error",
-                "code": "MISSING_CREDENTIALS",
-                "message": "Both username and password are required"
-            }), 400
+            return json_bytes_response(_MISSING_CREDENTIALS_BODY, 400)
         
         # Update the kubeconfig
         result = _update_server_kubeconfig(server_id, username, password)
@@ -791,17 +861,13 @@ def update_kubeconfig(server_id: str):
             return jsonify(result), 400
             
     except Exception as e:
-        return jsonify({
-            "type": "error",
-            "code": "UPDATE_FAILED",
-            "message": f"Failed to update kubeconfig: {str(e)}"
-        }), 500
+        return _error_response("UPDATE_FAILED", f"Failed to update kubeconfig: {str(e)}", 500)
 
 @server_config_bp.route('/servers/<server_id>/test-connection', methods=['POST'])
 def test_connection(server_id: str):
     """Test connection to a server."""
     try:
-        config = _load_master_config()
+        config = _load_master_config(cached=True)
         
         # Find the server
         server = None
@@ -811,26 +877,17 @@ def test_connection(server_id: str):
                 break
         
         if not server:
-            return jsonify({
-                "type": "error",
-                "code": "SERVER_NOT_FOUND",
-                "message": f"Server with ID '{server_id}' not found"
-            }), 404
+            return _error_response("SERVER_NOT_FOUND", f"Server with ID '{server_id}' not found", 404)
         
         # Test the connection by trying to get nodes
         try:
-            from providers.cloud_kubernetes_provider import CloudKubernetesProvider
             provider = CloudKubernetesProvider(server)
             
             # Ensure the provider is initialized
             provider._ensure_initialized()
             
             if not provider.core_v1:
-                return jsonify({
-                    "type": "error",
-                    "code": "PROVIDER_NOT_INITIALIZED",
-                    "message": f"Kubernetes provider not initialized for server '{server_id}'"
-                }), 500
+                return _error_response("PROVIDER_NOT_INITIALIZED", f"Kubernetes provider not initialized for server '{server_id}'", 500)
             
             nodes = provider.core_v1.list_node()
             
@@ -843,18 +900,10 @@ def test_connection(server_id: str):
                 }
             })
         except Exception as e:
-            return jsonify({
-                "type": "error",
-                "code": "CONNECTION_FAILED",
-                "message": f"Failed to connect to server '{server_id}': {str(e)}"
-            }), 500
+            return _error_response("CONNECTION_FAILED", f"Failed to connect to server '{server_id}': {str(e)}", 500)
             
     except Exception as e:
-        return jsonify({
-            "type": "error",
-            "code": "TEST_FAILED",
-            "message": f"Failed to test connection: {str(e)}"
-        }), 500
+        return _error_response("TEST_FAILED", f"Failed to test connection: {str(e)}", 500)
 
 @server_config_bp.route('/deconfigure/<server_id>', methods=['DELETE', 'OPTIONS'])
 def deconfigure_server(server_id: str):
@@ -931,18 +980,10 @@ def deconfigure_server(server_id: str):
                 })
         
         if not server_found:
-            return jsonify({
-                "type": "error",
-                "code": "SERVER_NOT_FOUND",
-                "message": f"Server with ID '{server_id}' not found"
-            }), 404
+            return _error_response("SERVER_NOT_FOUND", f"Server with ID '{server_id}' not found", 404)
             
     except Exception as e:
-        return jsonify({
-            "type": "error",
-            "code": "DECONFIGURE_FAILED",
-            "message": f"Failed to de-configure server: {str(e)}"
-        }), 500
+        return _error_response("DECONFIGURE_FAILED", f"Failed to de-configure server: {str(e)}", 500)
 
 @server_config_bp.route('/servers/<server_id>/refresh', methods=['POST'])
 def refresh_server_data(server_id: str):
@@ -951,30 +992,34 @@ def refresh_server_data(server_id: str):
         result = _fetch_and_update_live_data(server_id)
         return jsonify(result)
     except Exception as e:
-        return jsonify({
-            "type": "error",
-            "code": "REFRESH_FAILED",
-            "message": f"Failed to refresh server data: {str(e)}"
-        }), 500
+        return _error_response("REFRESH_FAILED", f"Failed to refresh server data: {str(e)}", 500)
 
 @server_config_bp.route('/servers/refresh-all', methods=['POST'])
 def refresh_all_servers():
-    """Refresh live data for all configured servers."""
+    """
+    Refresh live data for all configured servers.
+    
+    With Accept: application/x-ndjson the per-server results are streamed, one
+    line each as it completes, instead of returned together at the end.
+    """
     try:
-        config = _load_master_config()
+        config = _load_master_config(cached=True)
         servers = config.get('servers', [])
         
-        results = []
-        for server in servers:
-            server_id = server.get('id')
-            if server_id:
-                result = _fetch_and_update_live_data(server_id)
-                results.append({
-                    "server_id": server_id,
+        def refresh_each():
+            for server, result in _refresh_live_data([s for s in servers if s.get('id')]):
+                yield {
+                    "server_id": server.get('id'),
                     "server_name": server.get('name'),
                     "result": result
-                })
+                }
+        
+        if wants_ndjson():
+            return stream_ndjson(refresh_each())
         
+        # Fetches finish in any order; report them in configuration order
+        position = {server.get('id'): index for index, server in enumerate(servers)}
+        results = sorted(refresh_each(), key=lambda r: position[r["server_id"]])
         successful = sum(1 for r in results if r["result"]["type"] == "success")
         total = len(results)
         
@@ -990,11 +1035,7 @@ def refresh_all_servers():
         })
         
     except Exception as e:
-        return jsonify({
-            "type": "error",
-            "code": "REFRESH_ALL_FAILED",
-            "message": f"Failed to refresh all servers: {str(e)}"
-        }), 500
+        return _error_response("REFRESH_ALL_FAILED", f"Failed to refresh all servers: {str(e)}", 500)
 
 @server_config_bp.route('/background-refresh/status', methods=['GET'])
 def get_background_refresh_status():
@@ -1027,7 +1068,7 @@ def get_background_refresh_status():
     try:
         from core.background_refresh_service import background_refresh_service
         
-        config = _load_master_config()
+        config = _load_master_config(cached=True)
         refresh_config = config.get('config', {})
         
         return jsonify({
@@ -1042,11 +1083,7 @@ def get_background_refresh_status():
             }
         })
     except Exception as e:
-        return jsonify({
-            "type": "error",
-            "code": "BACKGROUND_REFRESH_STATUS_FAILED",
-            "message": f"Failed to get background refresh status: {str(e)}"
-        }), 500
+        return _error_response("BACKGROUND_REFRESH_STATUS_FAILED", f"Failed to get background refresh status: {str(e)}", 500)
 
 @server_config_bp.route('/background-refresh/start', methods=['POST'])
 def start_background_refresh():
@@ -1079,17 +1116,9 @@ def start_background_refresh():
         
         background_refresh_service.start()
         
-        return jsonify({
-            "type": "success",
-            "code": "BACKGROUND_REFRESH_STARTED",
-            "message": "Background refresh service started successfully"
-        })
+        return json_bytes_response(_REFRESH_STARTED_BODY)
     except Exception as e:
-        return jsonify({
-            "type": "error",
-            "code": "BACKGROUND_REFRESH_START_FAILED",
-            "message": f"Failed to start background refresh service: {str(e)}"
-        }), 500
+        return _error_response("BACKGROUND_REFRESH_START_FAILED", f"Failed to start background refresh service: {str(e)}", 500)
 
 @server_config_bp.route('/background-refresh/stop', methods=['POST'])
 def stop_background_refresh():
@@ -1121,14 +1150,6 @@ def stop_background_refresh():
         
         background_refresh_service.stop()
         
-        return jsonify({
-            "type": "success",
-            "code": "BACKGROUND_REFRESH_STOPPED",
-            "message": "Background refresh service stopped successfully"
-        })
+        return json_bytes_response(_REFRESH_STOPPED_BODY)
     except Exception as e:
-        return jsonify({
-            "type": "error",
-            "code": "BACKGROUND_REFRESH_STOP_FAILED",
-            "message": f"Failed to stop background refresh service: {str(e)}"
-        }), 500
+        return _error_response("BACKGROUND_REFRESH_STOP_FAILED", f"Failed to stop background refresh service: {str(e)}", 500)
@@ -8,28 +8,47 @@ import warnings
 warnings.filterwarnings('ignore', message='Unverified HTTPS request')
 warnings.filterwarnings('ignore', category=Warning, module='urllib3')
 
-import os
-import json
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from flask import  jsonify
 from typing import Dict, List, Optional
 from kubernetes import client, config
 from providers.cloud_kubernetes_provider import CloudKubernetesProvider
-from config.types import MasterConfig, ServerConfig
+from config.constants import FilePaths
+from config.types import (
+    MasterConfig, ServerConfig, create_default_master_config, validate_master_config
+)
 from config.utils import (
     get_available_resources,
     validate_resource_request,
     create_pod_k8s,
-    delete_pod_k8s
+    delete_pod_k8s,
+    load_json_file,
+    save_json_file,
+    get_file_signature
 )
 
+# Resource keys tracked in master.json allocated/available blocks
+_RESOURCE_KEYS = ("cpus", "ram_gb", "storage_gb", "gpus")
+
+# Shared pool for per-cluster fetches; each call is network-bound
+_CLUSTER_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='cluster-fetch')
+
 class ServerManager:
     """Manages server configurations and Kubernetes providers."""
     
+    # Provider class per (server type, connection method)
+    PROVIDER_CLASSES = {
+        ("kubernetes", "kubeconfig"): CloudKubernetesProvider,
+    }
+    SERVER_TYPES = frozenset(server_type for server_type, _ in PROVIDER_CLASSES)
+    
     def __init__(self):
         """Initialize the server manager."""
+        # Signature of master.json as of the last load, used to skip no-op reloads
+        self._master_config_signature = None
         self.master_config = self._load_master_config()
         self.server_providers = {}
         self._initialize_providers()
@@ -37,24 +56,45 @@ class ServerManager:
     def _load_master_config(self) -> MasterConfig:
         """Load master configuration from data/master.json."""
         try:
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-            with open(config_path, 'r') as f:
-                config_data = json.load(f)
-                from config.types import validate_master_config
-                return validate_master_config(config_data)
+            config_path = FilePaths.MASTER_CONFIG
+            # Stat before reading so a concurrent write is picked up by the next reload
+            signature = get_file_signature(config_path)
+            config_data = load_json_file(config_path)
+            master_config = validate_master_config(config_data)
+            self._master_config_signature = signature
+            return master_config
         except Exception as e:
             print(f"❌ Failed to load master config: {e}")
-            from config.types import create_default_master_config
+            self._master_config_signature = None
             return create_default_master_config()
     
-    def _initialize_providers(self):
-        """Initialize providers for all configured servers."""
+    def _initialize_providers(self, previous_providers: Optional[Dict] = None):
+        """
+        Initialize providers for all configured servers.
+        
+        Providers from previous_providers are reused in place when the server's
+        type and connection coordinates are unchanged, keeping their Kubernetes
+        clients and caches instead of rebuilding them.
+        """
+        previous_providers = previous_providers or {}
         print(f"🔧 Initializing providers for {len(self.master_config.get('servers', []))} servers")
         
         for server in self.master_config.get("servers", []):
             server_id = server.get("id")
             print(f"🔧 Processing server: {server_id}")
             
+            existing = previous_providers.get(server_id)
+            if existing and self._same_connection(existing["config"], server):
+                if existing["config"] != server:
+                    existing["provider"].invalidate_cache()
+                existing["provider"].server_config = server
+                self.server_providers[server_id] = {
+                    "provider": existing["provider"],
+                    "config": server
+                }
+                print(f"♻️  Reusing provider for server: {server_id}")
+                continue
+            
             if server_id:
                 try:
                     provider = self._create_provider(server)
@@ -74,6 +114,14 @@ class ServerManager:
         print(f"🔧 Total providers initialized: {len(self.server_providers)}")
         print(f"🔧 Provider IDs: {list(self.server_providers.keys())}")
     
+    @staticmethod
+    def _same_connection(old_config: Dict, new_config: Dict) -> bool:
+        """Check whether two server configs connect to the cluster the same way."""
+        return (
+            old_config.get("type") == new_config.get("type")
+            and old_config.get("connection_coordinates") == new_config.get("connection_coordinates")
+        )
+    
     def _create_provider(self, server_config: Dict):
         """Create appropriate provider based on server type and connection method."""
         server_type = server_config.get("type")
@@ -85,25 +133,52 @@ class ServerManager:
         print(f"   - Connection method: {connection_method}")
         print(f"   - Host: {connection_coords.get('host')}")
         
-        if server_type == "kubernetes":
-            # Use CloudKubernetesProvider for Azure VM or cloud connections
-            if connection_method == "kubeconfig" and connection_coords.get("host"):
-                print(f"✅ Using CloudKubernetesProvider for {server_config.get('id')} with kubeconfig")
-                try:
-                    provider = CloudKubernetesProvider(server_config)
-                    print(f"✅ CloudKubernetesProvider created successfully")
-                    return provider
-                except Exception as e:
-                    print(f"❌ Failed to create CloudKubernetesProvider: {e}")
-                    return None
-            else:
-                # No local provider support - only cloud/remote connections
-                print(f"❌ Unsupported connection method: {connection_method}")
-                print(f"   Only 'kubeconfig' with host is supported for Azure VM connections")
-                return None
-        else:
+        if server_type not in self.SERVER_TYPES:
             print(f"❌ Unknown server type: {server_type}")
             return None
+        
+        provider_class = self.PROVIDER_CLASSES.get((server_type, connection_method))
+        if provider_class is None or not connection_coords.get("host"):
+            # No local provider support - only cloud/remote connections
+            print(f"❌ Unsupported connection method: {connection_method}")
+            print(f"   Only 'kubeconfig' with host is supported for Azure VM connections")
+            return None
+        
+        provider_name = provider_class.__name__
+        print(f"✅ Using {provider_name} for {server_config.get('id')} with {connection_method}")
+        try:
+            provider = provider_class(server_config)
+            print(f"✅ {provider_name} created successfully")
+            return provider
+        except Exception as e:
+            print(f"❌ Failed to create {provider_name}: {e}")
+            return None
+    
+    @staticmethod
+    def _index_servers(master_config: Dict) -> Dict[str, Dict]:
+        """Index master config servers by id for O(1) lookups (first match wins, like a linear scan)."""
+        index = {}
+        for server in master_config.get("servers", []):
+            index.setdefault(server.get("id"), server)
+        return index
+    
+    @staticmethod
+    def _index_pods(server: Dict) -> Dict[str, Dict]:
+        """Index a server's pods by pod_id and name for O(1) lookups."""
+        pods_by_id = {}
+        for pod in server.get("pods", []):
+            for key in (pod.get("name"), pod.get("pod_id")):
+                if key:
+                    pods_by_id.setdefault(key, pod)
+        return pods_by_id
+    
+    def config_version(self):
+        """
+        Marker that changes whenever the master config may have changed: a reload
+        swaps the config object, and every persisted change rewrites master.json.
+        """
+        config_path = FilePaths.MASTER_CONFIG
+        return (id(self.master_config), get_file_signature(config_path))
     
     def get_server_ids(self) -> List[str]:
         """Get list of all server IDs."""
@@ -111,15 +186,13 @@ class ServerManager:
     
     def get_server_config(self, server_id: str) -> Optional[Dict]:
         """Get configuration for a specific server."""
-        if server_id in self.server_providers:
-            return self.server_providers[server_id]["config"]
-        return None
+        entry = self.server_providers.get(server_id)
+        return entry["config"] if entry else None
     
     def get_server_provider(self, server_id: str):
         """Get provider instance for a specific server."""
-        if server_id in self.server_providers:
-            return self.server_providers[server_id]["provider"]
-        return None
+        entry = self.server_providers.get(server_id)
+        return entry["provider"] if entry else None
     
     def get_all_servers_static(self) -> List[Dict]:
         """
@@ -129,118 +202,133 @@ class ServerManager:
         Returns:
             List of servers with their data from master.json
         """
-        all_servers = []
-        
         # Read directly from master.json without any provider initialization
-        for server_config in self.master_config.get("servers", []):
-            server_id = server_config.get("id")
-            server_name = server_config.get("name", server_id)
-            server_type = server_config.get("type", "unknown")
-            environment = server_config.get("environment", "unknown")
-            metadata = server_config.get("metadata", {})
-            
-            # Create server object from master.json data only
-            server_data = {
-                "id": server_id,  # Add id field for frontend compatibility
-                "server_id": server_id,
-                "name": server_name,  # Add name field for frontend compatibility
-                "server_name": server_name,
-                "server_type": server_type,
-                "metadata": metadata,
-                "environment": environment,
-                "status": server_config.get("status", "offline"),
-                "pods": server_config.get("pods", []),
-                "resources": server_config.get("resources", {
-                    "total": {}, 
-                    "allocated": {}, 
-                    "available": {}, 
-                    "actual_usage": {}
-                })
-            }
-            
-            all_servers.append(server_data)
+        return [
+            self._static_server_data(server_config)
+            for server_config in self.master_config.get("servers", [])
+        ]
+    
+    def get_server_static(self, server_id: str) -> Optional[Dict]:
+        """
+        Get one server and its pods from master.json only (no live sync).
         
-        return all_servers
+        Returns:
+            Server data shaped like get_all_servers_static entries, or None if not configured
+        """
+        server_config = self._index_servers(self.master_config).get(server_id)
+        return self._static_server_data(server_config) if server_config else None
+    
+    @staticmethod
+    def _static_server_data(server_config: Dict) -> Dict:
+        """Create a server object from its master.json data only."""
+        server_id = server_config.get("id")
+        server_name = server_config.get("name", server_id)
+        return {
+            "id": server_id,  # Add id field for frontend compatibility
+            "server_id": server_id,
+            "name": server_name,  # Add name field for frontend compatibility
+            "server_name": server_name,
+            "server_type": server_config.get("type", "unknown"),
+            "metadata": server_config.get("metadata", {}),
+            "environment": server_config.get("environment", "unknown"),
+            "status": server_config.get("status", "offline"),
+            "pods": server_config.get("pods", []),
+            "resources": server_config.get("resources", {
+                "total": {}, 
+                "allocated": {}, 
+                "available": {}, 
+                "actual_usage": {}
+            })
+        }
 
     def get_all_servers_with_pods(self) -> List[Dict]:
-        """Get all servers with their pods data."""
+        """
+        Get all servers with their pods data.
+        
+        Clusters are queried concurrently, so the call takes about as long as
+        the slowest cluster rather than the sum of all of them; results keep
+        the master.json server order.
+        """
         all_servers = []
         
         # Get all servers from master config, not just those with providers
-        for server_config in self.master_config.get("servers", []):
-            server_id = server_config.get("id")
-            server_name = server_config.get("name", server_id)
-            server_type = server_config.get("type", "unknown")
-            environment = server_config.get("environment", "unknown")
-            metadata = server_config.get("metadata", {})
-            
-            # Check if we have a provider for this server
-            if server_id in self.server_providers:
-                try:
-                    provider = self.server_providers[server_id]["provider"]
-                    
-                    # Get live data from provider
-                    servers_data = provider.get_servers_with_pods()
-                    
-                    # Add server metadata
-                    for server_data in servers_data:
-                        server_data["server_id"] = server_id
-                        server_data["server_name"] = server_name
-                        server_data["server_type"] = server_type
-                        server_data["metadata"] = metadata
-                        server_data["environment"] = environment
-                    
-                    all_servers.extend(servers_data)
-                    
-                except Exception as e:
-                    print(f"Error getting live data for server {server_id}: {e}")
-                    # Add server with error state but include static data
-                    error_server = {
+        for servers_data in _CLUSTER_EXECUTOR.map(
+            self._server_with_live_data, self.master_config.get("servers", [])
+        ):
+            all_servers.extend(servers_data)
+        
+        return all_servers
+    
+    def _server_with_live_data(self, server_config: ServerConfig) -> List[Dict]:
+        """Live data for one configured server, falling back to its static data."""
+        server_id = server_config.get("id")
+        server_name = server_config.get("name", server_id)
+        server_type = server_config.get("type", "unknown")
+        environment = server_config.get("environment", "unknown")
+        metadata = server_config.get("metadata", {})
+        
+        # Check if we have a provider for this server
+        provider = self.get_server_provider(server_id)
+        if provider:
+            try:
+                # Get live data from provider
+                servers_data = provider.get_servers_with_pods()
+                
+                # Add server metadata to copies: the provider's cached entries are
+                # shared with other requests and must stay read-only
+                return [
+                    {
+                        **server_data,
                         "server_id": server_id,
                         "server_name": server_name,
                         "server_type": server_type,
                         "metadata": metadata,
-                        "environment": environment,
-                        "status": "error",
-                        "pods": server_config.get("pods", []),
-                        "resources": server_config.get("resources", {"total": {}, "allocated": {}, "available": {}, "actual_usage": {}})
+                        "environment": environment
                     }
-                    all_servers.append(error_server)
-            else:
-                # Server doesn't have a provider (like dummy servers), use static data
-                static_server = {
-                    "server_id": server_id,
-                    "server_name": server_name,
-                    "server_type": server_type,
-                    "metadata": metadata,
-                    "environment": environment,
-                    "status": "offline",  # or "static" to indicate it's not live
-                    "pods": server_config.get("pods", []),
-                    "resources": server_config.get("resources", {"total": {}, "allocated": {}, "available": {}, "actual_usage": {}})
-                }
-                all_servers.append(static_server)
+                    for server_data in servers_data
+                ]
+                
+            except Exception as e:
+                print(f"Error getting live data for server {server_id}: {e}")
+                # Add server with error state but include static data
+                status = "error"
+        else:
+            # Server doesn't have a provider (like dummy servers), use static data
+            status = "offline"  # or "static" to indicate it's not live
         
-        return all_servers
+        return [{
+            "server_id": server_id,
+            "server_name": server_name,
+            "server_type": server_type,
+            "metadata": metadata,
+            "environment": environment,
+            "status": status,
+            "pods": server_config.get("pods", []),
+            "resources": server_config.get("resources", {"total": {}, "allocated": {}, "available": {}, "actual_usage": {}})
+        }]
     
     def get_server_with_pods(self, server_id: str) -> Optional[Dict]:
         """Get specific server with its pods data."""
-        if server_id not in self.server_providers:
+        entry = self.server_providers.get(server_id)
+        if not entry:
             return None
         
         try:
-            provider = self.server_providers[server_id]["provider"]
-            config = self.server_providers[server_id]["config"]
+            provider = entry["provider"]
+            config = entry["config"]
             
             servers_data = provider.get_servers_with_pods()
             
             if servers_data:
-                server_data = servers_data[0]  # Get first server
-                server_data["server_id"] = server_id
-                server_data["server_name"] = config.get("name", server_id)
-                server_data["server_type"] = config.get("type", "unknown")
-                server_data["metadata"] = config.get("metadata", {})
-                server_data["environment"] = config.get("environment", "unknown")
-                return server_data
+                # Copy the first server: the provider's cached entry must stay read-only
+                return {
+                    **servers_data[0],
+                    "server_id": server_id,
+                    "server_name": config.get("name", server_id),
+                    "server_type": config.get("type", "unknown"),
+                    "metadata": config.get("metadata", {}),
+                    "environment": config.get("environment", "unknown")
+                }
             
         except Exception as e:
             print(f"Error getting data for server {server_id}: {e}")
@@ -286,28 +374,22 @@ class ServerManager:
         }
 
         # Locate server
-        for server in self.master_config.get("servers", []):
-            if server.get("id") == server_id:
-                server.setdefault("pods", [])
+        server = self._index_servers(self.master_config).get(server_id)
+        if server is None:
+            raise ValueError(f"Server '{server_id}' not found in master config")
 
-                # Check for existing pod
-                for existing in server["pods"]:
-                    if (existing.get("pod_id") and existing.get("pod_id") == pod_id) or \
-                    (existing.get("name") and existing.get("name") == pod_id):
-                        print(f"❌ Pod '{pod_id}' already exists on server '{server_id}'")
-                        raise ValueError(f"Pod '{pod_id}' already exists on server '{server_id}'")
+        server.setdefault("pods", [])
 
-                # Append and persist
-                server["pods"].append(pending_pod)
-                config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-                temp_path = config_path + ".tmp"
-                with open(temp_path, "w") as f:
-                    json.dump(self.master_config, f, indent=2)
-                os.replace(temp_path, config_path)
-                return pending_pod
+        # Check for existing pod
+        if pod_id in self._index_pods(server):
+            print(f"❌ Pod '{pod_id}' already exists on server '{server_id}'")
+            raise ValueError(f"Pod '{pod_id}' already exists on server '{server_id}'")
 
-        # Server not found
-        raise ValueError(f"Server '{server_id}' not found in master config")
+        # Append and persist
+        server["pods"].append(pending_pod)
+        config_path = FilePaths.MASTER_CONFIG
+        save_json_file(config_path, self.master_config)
+        return pending_pod
 
 
     def validation_steps(self, pod_data) -> Dict:
@@ -319,8 +401,7 @@ class ServerManager:
         print(f"✅ Appended pending pod {pod_object.get('pod_id')}")
 
         # Validate resources against the static/master view
-        servers = self.get_all_servers_static()
-        server_data = next((s for s in servers if s.get('server_id') == server_id), None)
+        server_data = self._index_servers(self.master_config).get(server_id)
         if not server_data:
             raise ValueError(f"Server '{server_id}' not found")
 
@@ -328,7 +409,9 @@ class ServerManager:
         if not ok:
             raise ValueError(err)
         
-        provider = self.server_providers[server_id]["provider"]
+        provider = self.get_server_provider(server_id)
+        if not provider:
+            raise ValueError(f"Server '{server_id}' not found")
         
         # Get fresh live data for backend validation
         print(f"🔍 Validating pod creation for {pod_data.get('PodName', '')} on server {server_id}")
@@ -355,13 +438,15 @@ class ServerManager:
         except ValueError as e:
             return {'status': 'error', 'message': str(e)}
 
-        if server_id not in self.server_providers:
+        provider = self.get_server_provider(server_id)
+        if not provider:
             self.reload_config()
-            if server_id not in self.server_providers:
+            provider = self.get_server_provider(server_id)
+            if not provider:
                 return {"error": f"Server {server_id} not found"}
         try:
-            provider = self.server_providers[server_id]["provider"]
             result = provider.create_pod(pod_object)
+            provider.invalidate_cache()
             
             # OPTIMIZATION: Sync pods synchronously after successful creation
             if result.get('status') == 'success':
@@ -401,27 +486,19 @@ class ServerManager:
         pod_object["timestamp"] = datetime.now().isoformat()
 
         # Persist into master.json: replace existing pod entry or append
-        for server in self.master_config.get("servers", []):
-            if server.get("id") == server_id:
-                server.setdefault("pods", [])
-                replaced = False
-                for idx, existing in enumerate(server["pods"]):
-                    if (existing.get("pod_id") and existing.get("pod_id") == pod_id) or \
-                    (existing.get("name") and existing.get("name") == pod_id):
-                        server["pods"][idx] = pod_object
-                        replaced = True
-                        break
-                if not replaced:
-                    server["pods"].append(pod_object)
-                break
-
-        # Atomic write back
+        server = self._index_servers(self.master_config).get(server_id)
+        if server is not None:
+            server.setdefault("pods", [])
+            existing = self._index_pods(server).get(pod_id)
+            if existing is not None:
+                server["pods"][server["pods"].index(existing)] = pod_object
+            else:
+                server["pods"].append(pod_object)
+
+        # Write back (save_json_file replaces the file atomically)
         try:
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-            temp_path = config_path + ".tmp"
-            with open(temp_path, "w") as f:
-                json.dump(self.master_config, f, indent=2)
-            os.replace(temp_path, config_path)
+            config_path = FilePaths.MASTER_CONFIG
+            save_json_file(config_path, self.master_config)
         except Exception as e:
             print(f"Failed to persist updated pod_object to master.json: {e}")
 
@@ -432,28 +509,27 @@ class ServerManager:
         print(f"ServerManager: Deleting pod {pod_name} from server {server_id}")
         
         self.reload_config()
-        if server_id not in self.server_providers:
+        provider = self.get_server_provider(server_id)
+        if not provider:
             print(f"ServerManager: Server {server_id} not found")
             return {"error": f"Server {server_id} not found"}
         
         try:
             # Find the pod in master.json to get its namespace
             pod_namespace = None
-            for server in self.master_config.get('servers', []):
-                if server.get('id') == server_id:
-                    for pod in server.get('pods', []):
-                        if pod.get('pod_id') == pod_name or pod.get('name') == pod_name:
-                            pod_object = pod
-                            pod_namespace = pod.get('namespace', 'default')
-                            print(f"ServerManager: Found pod {pod_name} in namespace {pod_namespace}")
-                            break
-                    break
+            server = self._index_servers(self.master_config).get(server_id)
+            if server is not None:
+                pod = self._index_pods(server).get(pod_name)
+                if pod is not None:
+                    pod_object = pod
+                    pod_namespace = pod.get('namespace', 'default')
+                    print(f"ServerManager: Found pod {pod_name} in namespace {pod_namespace}")
             
-            provider = self.server_providers[server_id]["provider"]
             pod_data = pod_data or {"PodName": pod_name, "namespace": pod_namespace}
             print(f"ServerManager: Calling provider delete_pod with data: {pod_data}")
             
             result = provider.delete_pod(pod_data)
+            provider.invalidate_cache()
             print(f"ServerManager: Provider delete result: {result}")
             
             if result.get('status') == 'success':
@@ -466,15 +542,14 @@ class ServerManager:
                     print(f"ServerManager: Failed to release resources for pod {pod_name}: {e}")
                     # Fallback: manually remove from master.json
                 self.master_config = self._load_master_config()
-                for server in self.master_config.get('servers', []):
-                    if server.get('id') == server_id:
-                        original_count = len(server.get('pods', []))
-                        server['pods'] = [p for p in server.get('pods', []) if p.get('pod_id') != pod_name and p.get('name') != pod_name]
-                        new_count = len(server.get('pods', []))
-                        print(f"ServerManager: Removed {original_count - new_count} pods from master.json")
-                config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-                with open(config_path, 'w') as f:
-                    json.dump(self.master_config, f, indent=2)
+                server = self._index_servers(self.master_config).get(server_id)
+                if server is not None:
+                    original_count = len(server.get('pods', []))
+                    server['pods'] = [p for p in server.get('pods', []) if p.get('pod_id') != pod_name and p.get('name') != pod_name]
+                    new_count = len(server.get('pods', []))
+                    print(f"ServerManager: Removed {original_count - new_count} pods from master.json")
+                config_path = FilePaths.MASTER_CONFIG
+                save_json_file(config_path, self.master_config)
             else:
                 print(f"ServerManager: Pod deletion failed: {result}")
                 return {"error": f"Failed to delete pod: {result.get('message', 'Unknown error')}"}
@@ -484,20 +559,31 @@ class ServerManager:
             print(f"ServerManager: Exception during pod deletion: {e}")
             return {"error": f"Failed to delete pod: {e}"}
     
-    def reload_config(self):
-        """Reload the master configuration."""
+    def reload_config(self, force: bool = False):
+        """
+        Reload the master configuration, reusing providers whose connection is unchanged.
+        
+        Skipped when master.json is unchanged since the last load (every write
+        replaces the file, so its signature changes); pass force=True to reload anyway.
+        """
+        config_path = FilePaths.MASTER_CONFIG
+        signature = get_file_signature(config_path)
+        if not force and signature is not None and signature == self._master_config_signature:
+            return
+        
+        previous_providers = self.server_providers
         self.master_config = self._load_master_config()
         self.server_providers = {}
-        self._initialize_providers()
+        self._initialize_providers(previous_providers)
 
     def reserve_resources_in_master_simple(self,master_config: dict, server_id: str, pod_requested: dict) -> dict:
         """
         Subtract requested resources from available and add to allocated in master.json for given server_id.
-        Persists the change immediately by overwriting master.json (no temp file).
+        Persists the change immediately by atomically rewriting master.json.
         Returns the updated resources dict.
         """
         # Locate server
-        server = next((s for s in master_config.get("servers", []) if s.get("id") == server_id), None)
+        server = self._index_servers(master_config).get(server_id)
         if not server:
             raise ValueError(f"Server '{server_id}' not found in master config")
 
@@ -506,7 +592,7 @@ class ServerManager:
         resources = server["resources"]
 
         # Adjust each resource
-        for key in ["cpus", "ram_gb", "storage_gb", "gpus"]:
+        for key in _RESOURCE_KEYS:
             req = pod_requested.get(key, 0) or 0
             # Increase allocated
             prev_alloc = resources["allocated"].get(key, 0)
@@ -516,9 +602,8 @@ class ServerManager:
             resources["available"][key] = max(0, prev_avail - req)
 
         # Persist immediately (overwrite)
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-        with open(config_path, "w") as f:
-            json.dump(master_config, f, indent=2)
+        config_path = FilePaths.MASTER_CONFIG
+        save_json_file(config_path, master_config)
 
         return resources
     
@@ -529,7 +614,7 @@ class ServerManager:
         Returns updated resources dict.
         """
         print(f"ServerManager: Releasing resources for server {server_id} with request: {pod_requested}")
-        server = next((s for s in master_config.get("servers", []) if s.get("id") == server_id), None)
+        server = self._index_servers(master_config).get(server_id)
         if not server:
             raise ValueError(f"Server '{server_id}' not found in master config")
         
@@ -537,7 +622,7 @@ class ServerManager:
         allocated = resources["allocated"]
         available = resources["available"]
 
-        for key in ["cpus", "ram_gb", "storage_gb", "gpus"]:
+        for key in _RESOURCE_KEYS:
             req = pod_requested.get(key, 0) or 0
 
             # Decrease allocated (floor at 0)
@@ -548,10 +633,9 @@ class ServerManager:
             prev_avail = available.get(key, 0)
             available[key] = prev_avail + req
 
-            # Persist immediately
-            config_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'master.json')
-            with open(config_path, "w") as f:
-                json.dump(master_config, f, indent=2)
+        # Persist immediately (once, after all resources are adjusted)
+        config_path = FilePaths.MASTER_CONFIG
+        save_json_file(config_path, master_config)
 
         return resources
 
@@ -0,0 +1,26 @@
+"""
+Gunicorn Configuration
+Production server settings for the Resource Manager backend (used by start.sh).
+
+The gevent worker runs each request in a greenlet with sockets monkey-patched,
+so Kubernetes API round trips and health checks overlap inside one process
+instead of blocking it. Server state (providers, caches) is per process, so a
+single worker is the default.
+"""
+
+import os
+
+from config.constants import Ports
+
+bind = f"0.0.0.0:{Ports.get_backend_port()}"
+worker_class = "gevent"
+workers = int(os.getenv("GUNICORN_WORKERS", "1"))
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "100"))
+# Pod creation waits on the cluster; allow slow requests before recycling a worker
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+
+
+def post_worker_init(worker):
+    """Start cluster health monitoring in each worker so /health serves its latest results."""
+    from core.health_monitor import health_monitor
+    health_monitor.start_monitoring()
@@ -1,22 +1,27 @@
 #!/usr/bin/env python3
 """
 Resource Manager Backend - Main Entry Point
-This is the main entry point for the Flask backend application.
+Starts the backend under gunicorn with the gevent worker (settings in
+gunicorn.conf.py), the same server start.sh uses.
 """
 
 import sys
 import os
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# Import the Flask app from the core module
-from core.app import app
+# Add the current directory to Python path
+sys.path.insert(0, BASE_DIR)
 
 if __name__ == '__main__':
-    # Run the Flask application
-    app.run(
-        host='0.0.0.0',
-        port=5005,
-        debug=True
-    ) 
\ No newline at end of file
+    # Run the Flask application through gunicorn instead of the single-threaded
+    # debug server; the app itself is imported by each worker via wsgi.py
+    from gunicorn.app.wsgiapp import run
+
+    sys.argv = [
+        'gunicorn',
+        '--chdir', BASE_DIR,
+        '-c', os.path.join(BASE_DIR, 'gunicorn.conf.py'),
+        'wsgi:app'
+    ]
+    run()
@@ -7,11 +7,15 @@ import json
 import os
 import subprocess
 import tempfile
+import threading
+import time
+import uuid
 import warnings
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from kubernetes import client, config as k8s_config
 from kubernetes.client.rest import ApiException
+from urllib3.util.retry import Retry
 
 # Suppress SSL/TLS warnings for development environments
 warnings.filterwarnings("ignore", message="Unverified HTTPS request")
@@ -24,9 +28,29 @@ from config.constants import (
     ErrorMessages,
     TimeFormats,
     KubernetesConstants,
+    CacheConfig,
 )
 from config.utils import map_kubernetes_status_to_user_friendly
 
+# Resource keys subtracted from node availability per running pod
+_RESOURCE_KEYS = ("cpus", "ram_gb", "storage_gb", "gpus")
+
+# Pod phase -> user-friendly status (anything else is unknown)
+_PHASE_STATUS = {
+    "Running": PodStatus.ONLINE.value,
+    "Pending": PodStatus.PENDING.value,
+    "Failed": PodStatus.FAILED.value,
+    "Succeeded": PodStatus.ONLINE.value,
+}
+
+# Namespaces whose pods are not reported as user workloads
+_SKIPPED_NAMESPACES = frozenset({"kube-system", "default"})
+
+# Image keywords used to estimate resources for containers without requests/limits
+_WEB_SERVER_IMAGES = ("nginx", "httpd", "apache")
+_RUNTIME_IMAGES = ("python", "node", "java", "golang")
+_DATABASE_IMAGES = ("database", "mysql", "postgres", "redis")
+
 
 class CloudKubernetesProvider:
     """Manages cloud Kubernetes resources (Azure AKS, GKE, Azure VM, etc.)."""
@@ -34,9 +58,16 @@ class CloudKubernetesProvider:
     def __init__(self, server_config: Dict = None):
         """Initialize cloud Kubernetes client."""
         self.server_config = server_config
+        self.api_client = None
         self.core_v1 = None
         self.apps_v1 = None
         self._initialized = False
+        # Short-lived cache of cluster reads: key -> (monotonic timestamp, value)
+        self._cache = {}
+        # One lock per cache key so concurrent misses share a single fetch
+        self._cache_locks = {}
+        # Bumped by invalidate_cache so fetches started before a mutation are not stored
+        self._cache_generation = 0
 
         # Don't initialize immediately - wait until first use
         # This prevents password prompts during startup
@@ -56,20 +87,75 @@ class CloudKubernetesProvider:
                         )
                         return
                     kubeconfig_data = connection_coords.get("kubeconfig_data")
-                    k8s_config.load_kube_config_from_dict(kubeconfig_data)
-                    self.core_v1 = client.CoreV1Api()
-                    self.apps_v1 = client.AppsV1Api()
+                    # Load into this provider's own configuration and share one
+                    # ApiClient (one connection pool) across all API groups
+                    configuration = client.Configuration()
+                    k8s_config.load_kube_config_from_dict(
+                        kubeconfig_data, client_configuration=configuration
+                    )
+                    configuration.connection_pool_maxsize = KubernetesConstants.CONNECTION_POOL_MAXSIZE
+                    configuration.retries = Retry(
+                        total=KubernetesConstants.REQUEST_RETRIES, connect=0,
+                        backoff_factor=KubernetesConstants.REQUEST_RETRY_BACKOFF
+                    )
+                    self.api_client = client.ApiClient(configuration)
+                    self.core_v1 = client.CoreV1Api(self.api_client)
+                    self.apps_v1 = client.AppsV1Api(self.api_client)
                     print("✅ Kubeconfig loaded from dict using load_kube_config_from_dict")
                 except Exception as e:
                     print(f"Failed to initialize with server config: {e}")
 
+    def _get_cached(self, key: str, loader):
+        """
+        Return a cached cluster read if still fresh, otherwise reload it.
+
+        Concurrent callers missing the same key wait for one in-flight load
+        and reuse its result instead of each querying the API server. If the
+        reload fails, the last good value is returned (stale) rather than
+        failing the caller; with nothing cached the error is raised.
+        """
+        entry = self._cache.get(key)
+        if entry and time.monotonic() - entry[0] < CacheConfig.PROVIDER_DATA_TTL:
+            return entry[1]
+
+        with self._cache_locks.setdefault(key, threading.Lock()):
+            # Another caller may have finished the load while we waited
+            entry = self._cache.get(key)
+            now = time.monotonic()
+            if entry and now - entry[0] < CacheConfig.PROVIDER_DATA_TTL:
+                return entry[1]
+
+            generation = self._cache_generation
+            try:
+                value = loader()
+            except Exception as e:
+                if entry is None:
+                    raise
+                print(f"⚠️  Serving stale '{key}' data after failed refresh: {e}")
+                return entry[1]
+            if generation == self._cache_generation:
+                self._cache[key] = (now, value)
+            return value
+
+    def invalidate_cache(self):
+        """Drop cached cluster reads after a mutation."""
+        self._cache_generation += 1
+        self._cache.clear()
+
     def get_servers_with_pods(self) -> List[Dict]:
         """
-        Get cloud Kubernetes nodes and their pods.
+        Get cloud Kubernetes nodes and their pods (cached for a short TTL).
+        
+        The returned list is shared with other callers until the TTL expires;
+        copy entries before changing them.
 
         Returns:
             List of cloud Kubernetes nodes with pods
         """
+        return self._get_cached("servers_with_pods", self._fetch_servers_with_pods)
+
+    def _fetch_servers_with_pods(self) -> List[Dict]:
+        """Fetch cloud Kubernetes nodes and their pods from the API server."""
         try:
             # Check if this is a dummy server
             if self.server_config and self.server_config.get(
@@ -103,8 +189,14 @@ class CloudKubernetesProvider:
             # Initialize client on first use
             self._ensure_initialized()
 
-            nodes = self.core_v1.list_node()
-            pods = self.core_v1.list_pod_for_all_namespaces()
+            # One list call per kind for the whole cluster, served from the
+            # API server's watch cache
+            nodes = self.core_v1.list_node(
+                resource_version=KubernetesConstants.CACHED_LIST_RESOURCE_VERSION
+            )
+            pods = self.core_v1.list_pod_for_all_namespaces(
+                resource_version=KubernetesConstants.CACHED_LIST_RESOURCE_VERSION
+            )
 
             # Create node list
             node_list = []
@@ -234,7 +326,7 @@ class CloudKubernetesProvider:
         """
         try:
             # Skip system pods
-            if pod.metadata.namespace in ["kube-system", "default"]:
+            if pod.metadata.namespace in _SKIPPED_NAMESPACES:
                 return None
 
             # Extract resources
@@ -341,21 +433,13 @@ class CloudKubernetesProvider:
                 else:
                     # Default estimates for common container types
                     image = container.image.lower()
-                    if any(
-                        keyword in image for keyword in ["nginx", "httpd", "apache"]
-                    ):
+                    if any(keyword in image for keyword in _WEB_SERVER_IMAGES):
                         resources["cpus"] += 0.1
                         resources["ram_gb"] += 0.1
-                    elif any(
-                        keyword in image
-                        for keyword in ["python", "node", "java", "golang"]
-                    ):
+                    elif any(keyword in image for keyword in _RUNTIME_IMAGES):
                         resources["cpus"] += 0.5
                         resources["ram_gb"] += 0.5
-                    elif any(
-                        keyword in image
-                        for keyword in ["database", "mysql", "postgres", "redis"]
-                    ):
+                    elif any(keyword in image for keyword in _DATABASE_IMAGES):
                         resources["cpus"] += 1.0
                         resources["ram_gb"] += 1.0
                     else:
@@ -378,9 +462,7 @@ class CloudKubernetesProvider:
         try:
             # Try to get metrics from metrics.k8s.io API
             # Note: This requires metrics-server to be installed
-            from kubernetes.client import CustomObjectsApi
-
-            custom_api = CustomObjectsApi()
+            custom_api = client.CustomObjectsApi(self.api_client)
 
             # Get pod metrics
             metrics = custom_api.list_namespaced_custom_object(
@@ -433,18 +515,7 @@ class CloudKubernetesProvider:
         if not pod.status:
             return PodStatus.UNKNOWN.value
 
-        phase = pod.status.phase
-
-        if phase == "Running":
-            return PodStatus.ONLINE.value
-        elif phase == "Pending":
-            return PodStatus.PENDING.value
-        elif phase == "Failed":
-            return PodStatus.FAILED.value
-        elif phase == "Succeeded":
-            return PodStatus.ONLINE.value
-        else:
-            return PodStatus.UNKNOWN.value
+        return _PHASE_STATUS.get(pod.status.phase, PodStatus.UNKNOWN.value)
 
     def _get_node_index(self, node_name: str, node_list: List[Dict]) -> Optional[int]:
         """
@@ -469,25 +540,20 @@ class CloudKubernetesProvider:
         Args:
             node: Node dictionary to update
         """
-        total = node["resources"]["total"]
-        available = node["resources"]["available"].copy()
+        # "available" is already this node's own copy (see _extract_node_resources),
+        # so subtract pod resources in place rather than copying it again
+        available = node["resources"]["available"]
 
-        # Subtract pod resources
         for pod in node.get("pods", []):
             requested = pod.get("requested", {})
-            for key in ["cpus", "ram_gb", "storage_gb", "gpus"]:
+            for key in _RESOURCE_KEYS:
                 available[key] = max(0, available[key] - requested.get(key, 0))
 
-        node["resources"]["available"] = available
-
     def create_pod(self, pod_data: Dict) -> Dict:
         """Create multiple pod replicas in a dynamic namespace (from payload or default to 'default')."""
         self._ensure_initialized()
         print(f"Creating pod with data: {pod_data}")
         try:
-            import uuid
-            import time
-
             base_name = pod_data.get("pod_id") or f"deployment-{uuid.uuid4().hex[:8]}"
             resources = pod_data.get("requested", {}) or {}
             image_url = pod_data.get("image_url", "nginx:latest")
@@ -552,10 +618,10 @@ class CloudKubernetesProvider:
 
             # Wait for at least one pod to become ready
             timeout = 60  # seconds
-            start = time.time()
+            start = time.monotonic()
             ready_pod = None
             label_selector = f"app={base_name}"
-            while time.time() - start < timeout:
+            while time.monotonic() - start < timeout:
                 try:
                     pods_resp = self.core_v1.list_namespaced_pod(
                         namespace=namespace, label_selector=label_selector
@@ -663,11 +729,9 @@ class CloudKubernetesProvider:
                 return {"status": "error", "message": f"Failed to delete namespace: {e}"}
 
             # Wait for namespace to actually disappear
-            import time
-
             timeout = 60  # seconds
-            start = time.time()
-            while time.time() - start < timeout:
+            start = time.monotonic()
+            while time.monotonic() - start < timeout:
                 try:
                     self.core_v1.read_namespace(name=namespace)
                     # Still exists
@@ -705,6 +769,14 @@ class CloudKubernetesProvider:
             return {"status": "error", "message": f"Failed to delete namespace: {e}"}
 
     def get_cluster_available_resources_raw(self) -> dict:
+        """
+        Aggregate available cluster-level resources (cached for a short TTL).
+        """
+        return self._get_cached(
+            "cluster_available_resources", self._fetch_cluster_available_resources_raw
+        )
+
+    def _fetch_cluster_available_resources_raw(self) -> dict:
         """
         Aggregate available cluster-level resources by summing allocatable across all nodes
         and subtracting pod requests. Returns raw values with keys: cpus, ram_gb, storage_gb, gpus.
@@ -97,8 +97,8 @@ export AZURE_VM_IP=${AZURE_VM_IP:-4.246.178.26}
 export AZURE_VM_KUBECONFIG=${AZURE_VM_KUBECONFIG:-./azure_vm_kubeconfig_updated}
 export ENVIRONMENT=${ENVIRONMENT:-live}
 
-# Start backend in background
-python main.py > logs/backend.log 2>&1 &
+# Start backend in background (gunicorn + gevent so slow Kubernetes calls don't block other requests)
+gunicorn -c gunicorn.conf.py wsgi:app > logs/backend.log 2>&1 &
 BACKEND_PID=$!
 echo $BACKEND_PID > logs/backend.pid
 
@@ -0,0 +1,101 @@
+"""
+Test file for the cloud Kubernetes provider's read cache.
+"""
+
+import threading
+import time
+
+from core.server_manager import ServerManager
+from providers.cloud_kubernetes_provider import CloudKubernetesProvider
+
+
+def test_cached_reads_are_coalesced():
+    """Test that concurrent cache misses share one load."""
+    provider = CloudKubernetesProvider()
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        time.sleep(0.1)
+        return ["node"]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(provider._get_cached("nodes", slow_loader)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+    print("✅ Concurrent cached reads are coalesced")
+
+
+def test_invalidation_discards_in_flight_load():
+    """Test that a load started before invalidate_cache is not stored."""
+    provider = CloudKubernetesProvider()
+
+    def loader_racing_a_mutation():
+        provider.invalidate_cache()
+        return ["stale"]
+
+    assert provider._get_cached("nodes", loader_racing_a_mutation) == ["stale"]
+    assert provider._get_cached("nodes", lambda: ["fresh"]) == ["fresh"]
+
+    print("✅ Invalidation discards in-flight loads")
+
+
+def test_failed_refresh_serves_stale_value():
+    """Test that an expired entry is served when its reload fails."""
+    provider = CloudKubernetesProvider()
+    assert provider._get_cached("nodes", lambda: ["node"]) == ["node"]
+
+    # Expire the entry, then fail the reload
+    timestamp, value = provider._cache["nodes"]
+    provider._cache["nodes"] = (timestamp - 3600, value)
+
+    def failing_loader():
+        raise ConnectionError("API server unreachable")
+
+    assert provider._get_cached("nodes", failing_loader) == ["node"]
+
+    # Nothing to fall back on after invalidation
+    provider.invalidate_cache()
+    try:
+        provider._get_cached("nodes", failing_loader)
+        assert False, "expected the load error"
+    except ConnectionError:
+        pass
+
+    print("✅ Failed refreshes fall back to the last good value")
+
+
+def test_server_manager_leaves_cached_servers_unchanged():
+    """Test that ServerManager adds server metadata to copies, not to cached entries."""
+    provider = CloudKubernetesProvider()
+    cached_server = {"name": "node-1", "pods": []}
+    provider._cache["servers_with_pods"] = (time.monotonic(), [cached_server])
+
+    server_config = {"id": "cluster-1", "name": "Cluster 1", "type": "kubernetes"}
+    manager = ServerManager.__new__(ServerManager)
+    manager.master_config = {"servers": [server_config]}
+    manager.server_providers = {"cluster-1": {"provider": provider, "config": server_config}}
+
+    assert manager.get_all_servers_with_pods()[0]["server_name"] == "Cluster 1"
+    assert manager.get_server_with_pods("cluster-1")["server_id"] == "cluster-1"
+    assert cached_server == {"name": "node-1", "pods": []}
+
+    print("✅ Cached provider data stays read-only")
+
+
+if __name__ == "__main__":
+    print("🧪 Running cloud Kubernetes provider tests...")
+
+    test_cached_reads_are_coalesced()
+    test_invalidation_discards_in_flight_load()
+    test_failed_refresh_serves_stale_value()
+    test_server_manager_leaves_cached_servers_unchanged()
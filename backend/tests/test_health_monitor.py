@@ -0,0 +1,46 @@
+"""
+Test file for the cluster health monitor.
+"""
+
+import threading
+import time
+
+from core.health_monitor import ClusterHealthMonitor
+
+
+def test_force_health_check_coalesces():
+    """Test that concurrent forced checks share one in-flight check."""
+    monitor = ClusterHealthMonitor()
+    calls = []
+
+    def slow_checks():
+        calls.append(1)
+        time.sleep(0.1)
+
+    monitor._perform_health_checks = slow_checks
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(monitor.force_health_check()))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+    # Once the cached result expires the next call checks again
+    monitor._forced_check_result = (results[0], time.monotonic() - 1)
+    monitor.force_health_check()
+    assert len(calls) == 2
+
+    print("✅ Forced health checks are coalesced")
+
+
+if __name__ == "__main__":
+    print("🧪 Running health monitor tests...")
+
+    test_force_health_check_coalesces()
@@ -0,0 +1,192 @@
+"""
+Test file for the orjson-backed JSON response helpers.
+"""
+
+import gzip
+
+from flask import Flask
+
+from core import json_provider
+from core.json_provider import (
+    ORJSONProvider, cached_conditional_jsonify, compress_response, conditional_jsonify,
+    stream_ndjson, wants_ndjson
+)
+
+
+def _make_app(versions, builds):
+    """Build a minimal app serving one cached endpoint."""
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+
+    @app.route('/items')
+    def items():
+        def build():
+            builds.append(1)
+            return [{"b": 2, "a": versions[-1]}]
+        return cached_conditional_jsonify('test-items', versions[-1], build)
+
+    return app
+
+
+def test_cached_conditional_jsonify():
+    """Test body reuse, ETag revalidation and invalidation on version change."""
+    versions, builds = [1], []
+    client = _make_app(versions, builds).test_client()
+
+    first = client.get('/items')
+    assert first.status_code == 200
+    assert first.data == b'[{"a":1,"b":2}]\n'
+    assert first.headers['Cache-Control'] == 'no-cache'
+
+    etag = first.headers['ETag']
+    assert client.get('/items', headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/items').data == first.data
+    assert len(builds) == 1
+
+    versions.append(2)
+    changed = client.get('/items', headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.data == b'[{"a":2,"b":2}]\n'
+    assert len(builds) == 2
+
+    print("✅ Cached JSON bodies are reused until their version changes")
+
+
+def test_request_bodies_parse_through_orjson_provider():
+    """Test that get_json() parses the raw body bytes with the app's orjson provider."""
+    parsed = []
+
+    class RecordingProvider(ORJSONProvider):
+        def loads(self, s, **kwargs):
+            parsed.append(s)
+            return super().loads(s, **kwargs)
+
+    app = Flask(__name__)
+    app.json = RecordingProvider(app)
+
+    @app.route('/echo', methods=['POST'])
+    def echo():
+        from flask import request
+        body = request.get_json(silent=True)
+        # Cached: a second call must not parse again
+        assert request.get_json(silent=True) is body
+        return app.json.response(body)
+
+    response = app.test_client().post('/echo', json={"server_id": "s1"})
+    assert len(parsed) == 1
+    assert isinstance(parsed[0], bytes)
+    assert response.data == b'{"server_id":"s1"}\n'
+
+    print("✅ Request bodies are parsed once by the orjson provider")
+
+
+def test_stream_ndjson():
+    """Test that NDJSON is only chosen when asked for and writes one line per item."""
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+
+    @app.route('/results')
+    def results():
+        if wants_ndjson():
+            return stream_ndjson({"id": i, "ok": i % 2 == 0} for i in range(3))
+        return app.json.response([])
+
+    client = app.test_client()
+    assert client.get('/results').mimetype == 'application/json'
+
+    streamed = client.get('/results', headers={'Accept': 'application/x-ndjson'})
+    assert streamed.mimetype == 'application/x-ndjson'
+    assert streamed.data == b'{"id":0,"ok":true}\n{"id":1,"ok":false}\n{"id":2,"ok":true}\n'
+
+    print("✅ NDJSON responses stream one line per item")
+
+
+def test_compress_response():
+    """Test that large JSON bodies are gzipped only for clients that accept it."""
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    app.after_request(compress_response)
+    payload = [{"server_id": f"server-{i}", "status": "Online"} for i in range(100)]
+
+    @app.route('/large')
+    def large():
+        return conditional_jsonify(payload)
+
+    @app.route('/small')
+    def small():
+        return app.json.response({"ok": True})
+
+    client = app.test_client()
+    plain = client.get('/large')
+    assert 'Content-Encoding' not in plain.headers
+    assert 'Accept-Encoding' in plain.headers['Vary']
+
+    compressed = client.get('/large', headers={'Accept-Encoding': 'gzip'})
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(compressed.data) == plain.data
+    assert len(compressed.data) < len(plain.data)
+    assert compressed.headers['ETag'] == 'W/' + plain.headers['ETag']
+
+    # The weak ETag still revalidates
+    revalidated = client.get('/large', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': compressed.headers['ETag']
+    })
+    assert revalidated.status_code == 304
+
+    small_response = client.get('/small', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in small_response.headers
+
+    print("✅ Large JSON responses are gzipped when accepted")
+
+
+def test_cached_bodies_are_gzipped_once():
+    """Test that cached bodies keep their gzipped form instead of recompressing per request."""
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    app.after_request(compress_response)
+    payload = [{"server_id": f"server-{i}", "status": "Online"} for i in range(100)]
+
+    @app.route('/servers')
+    def servers():
+        return cached_conditional_jsonify('test-gzip', 1, lambda: payload)
+
+    compressions = []
+    original_gzip = json_provider._gzip
+
+    def counting_gzip(body):
+        compressions.append(1)
+        return original_gzip(body)
+
+    json_provider._gzip = counting_gzip
+    try:
+        client = app.test_client()
+        plain = client.get('/servers')
+        first = client.get('/servers', headers={'Accept-Encoding': 'gzip'})
+        second = client.get('/servers', headers={'Accept-Encoding': 'gzip'})
+    finally:
+        json_provider._gzip = original_gzip
+
+    assert 'Content-Encoding' not in plain.headers
+    assert first.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in first.headers['Vary']
+    assert gzip.decompress(first.data) == plain.data
+    assert second.data == first.data
+    assert len(compressions) == 1
+    assert first.headers['ETag'] == 'W/' + plain.headers['ETag']
+
+    revalidated = client.get('/servers', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': first.headers['ETag']
+    })
+    assert revalidated.status_code == 304
+
+    print("✅ Cached bodies are gzipped once per version")
+
+
+if __name__ == "__main__":
+    print("🧪 Running JSON provider tests...")
+
+    test_cached_conditional_jsonify()
+    test_request_bodies_parse_through_orjson_provider()
+    test_stream_ndjson()
+    test_compress_response()
+    test_cached_bodies_are_gzipped_once()
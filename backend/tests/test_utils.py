@@ -0,0 +1,162 @@
+"""
+Test file for utility helpers.
+"""
+
+import json
+import os
+import tempfile
+
+from config.types import create_default_master_config, create_default_server_config
+from config.utils import (
+    get_file_signature, is_valid_pod_name, load_json_file, save_json_file,
+    validate_pod_creation_input, validate_server_resources
+)
+
+
+def test_json_file_round_trip():
+    """Test saving and loading master config through the JSON helpers."""
+    config = create_default_master_config()
+    config['servers'].append(create_default_server_config(
+        "test-server", "Test Server", "192.168.1.1", "testuser", "testpass"
+    ))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_file = os.path.join(temp_dir, 'master.json')
+        save_json_file(temp_file, config)
+
+        # File must stay readable by the stdlib json module
+        with open(temp_file, 'r') as f:
+            assert json.load(f) == config
+
+        assert load_json_file(temp_file) == config
+
+        # Atomic replace leaves no temporary files behind
+        assert os.listdir(temp_dir) == ['master.json']
+
+        # Every save replaces the file, so its signature changes
+        signature = get_file_signature(temp_file)
+        save_json_file(temp_file, config)
+        assert get_file_signature(temp_file) != signature
+        assert get_file_signature(os.path.join(temp_dir, 'missing.json')) is None
+
+    print("✅ JSON file helpers round-trip master config")
+
+
+def test_cached_json_file_invalidation():
+    """Test that cached loads are reused until the file is rewritten."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_file = os.path.join(temp_dir, 'master.json')
+        save_json_file(temp_file, create_default_master_config())
+
+        first = load_json_file(temp_file, cached=True)
+        assert load_json_file(temp_file, cached=True) is first
+        assert load_json_file(temp_file) is not first
+
+        updated = create_default_master_config()
+        updated['config']['ui_refresh_interval'] = 10
+        save_json_file(temp_file, updated)
+
+        reloaded = load_json_file(temp_file, cached=True)
+        assert reloaded is not first
+        assert reloaded is not updated
+        assert reloaded['config']['ui_refresh_interval'] == 10
+
+        # Mutating the saved object must not leak into the cached copy
+        updated['config']['ui_refresh_interval'] = 20
+        assert load_json_file(temp_file, cached=True)['config']['ui_refresh_interval'] == 10
+
+    print("✅ Cached JSON loads are invalidated on write")
+
+
+def test_validate_server_resources():
+    """Test resource consistency checks for a single server."""
+    server = {
+        "name": "Test Server",
+        "resources": {
+            "total": {"cpus": 4, "ram_gb": 8, "storage_gb": 100, "gpus": 0},
+            "available": {"cpus": 2, "ram_gb": 4, "storage_gb": 90, "gpus": 0}
+        },
+        "pods": [
+            {"requested": {"cpus": 1, "ram_gb": 2, "storage_gb": 5, "gpus": 0}},
+            {"requested": {"cpus": 1, "ram_gb": 2, "storage_gb": 5, "gpus": 0}},
+            "not-a-pod"
+        ]
+    }
+    assert validate_server_resources(server) == []
+
+    server["resources"]["available"]["cpus"] = 5
+    server["pods"].append({"requested": {"ram_gb": 6}})
+    assert validate_server_resources(server) == [
+        "Server Test Server: available cpus > total cpus",
+        "Server Test Server: sum of pod ram_gb > total ram_gb"
+    ]
+
+    print("✅ Server resource validation works")
+
+
+def test_validate_pod_creation_input():
+    """Test /create payload validation."""
+    valid_request = {
+        "server_id": "test-server",
+        "pod_name": "test-pod",
+        "replicas": 2,
+        "Resources": {"cpus": 1, "ram_gb": 2, "storage_gb": 10, "gpus": 0}
+    }
+    assert validate_pod_creation_input(valid_request) == []
+
+    # Pod name is optional
+    assert validate_pod_creation_input({"server_id": "test-server"}) == []
+
+    # All errors are collected together
+    errors = validate_pod_creation_input({
+        "pod_name": "TEST_POD",
+        "replicas": 0,
+        "Resources": "invalid"
+    })
+    assert errors == [
+        "server_id is required",
+        "Pod name must be lowercase.",
+        "Pod name must not contain underscores.",
+        "Replica count must be an integer between 1 and 100",
+        "Resources must be a dictionary/object"
+    ]
+
+    assert validate_pod_creation_input({"server_id": "s", "pod_name": "a" * 64})
+
+    # The whole name must match: a trailing newline is not allowed through
+    assert validate_pod_creation_input({"server_id": "s", "pod_name": "abc\n"}) == [
+        "Pod name must be at most 63 lowercase alphanumeric characters or '-', "
+        "starting and ending with an alphanumeric character."
+    ]
+
+    # Names without letters are not reported as uppercase
+    assert validate_pod_creation_input({"server_id": "s", "pod_name": "1_2"}) == [
+        "Pod name must not contain underscores."
+    ]
+
+    # Resource amounts are not validated here; null counts as 0 when reserving
+    assert validate_pod_creation_input({"server_id": "s", "Resources": {"ram_gb": None}}) == []
+
+    print("✅ Pod creation input validation works")
+
+
+def test_is_valid_pod_name():
+    """Test the DNS-1123 pod name check shared by /create and /delete."""
+    assert is_valid_pod_name("test-pod")
+    assert is_valid_pod_name("a" * 63)
+
+    for name in ("", "abc\n", "Test-pod", "test_pod", "-test", "test-", "a" * 64,
+                 "app,app!=other", None, 5):
+        assert not is_valid_pod_name(name), name
+
+    print("✅ Pod name validation works")
+
+
+if __name__ == "__main__":
+    print("🧪 Running utility tests...")
+
+    test_json_file_round_trip()
+    test_cached_json_file_invalidation()
+    test_validate_server_resources()
+    test_validate_pod_creation_input()
+    test_is_valid_pod_name()
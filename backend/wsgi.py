@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Resource Manager Backend - WSGI Entry Point
+Exposes the Flask app for a production WSGI server, e.g.:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+The gevent worker monkey-patches sockets before this module is imported, so
+Kubernetes API calls yield to other requests instead of blocking the worker.
+Server state (providers, caches) is per process; keep a single worker unless
+every instance can tolerate only sharing data/master.json.
+"""
+
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Import the Flask app from the core module
+from core.app import app